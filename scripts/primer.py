@@ -4,27 +4,151 @@
 from __future__ import annotations
 
 import argparse
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import contextlib
+import io
+import itertools
 import json
 import logging
 import os
+import re
+import selectors
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterator
 
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
 
-def restore_primer_files(
-    temp_script: Path, temp_config: Path, primer_script: Path, primer_config: Path
+
+# Number of repositories to clone or update at once
+MAX_CONCURRENT_CLONES = 8
+
+# Longest a timeout watcher sleeps between progress checks, in seconds
+MAX_POLL_INTERVAL = 10.0
+
+# Validation compares against the interpreter's own tokenize module, whose
+# output changes between Python versions. Venvs and cached results are kept
+# apart per interpreter, e.g. "cpython-313".
+PYTHON_TAG = (
+    f"{sys.implementation.name}-{sys.version_info.major}{sys.version_info.minor}"
+)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson if it is installed as it is a lot faster."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize to indented JSON, using orjson if it is installed."""
+    if HAS_ORJSON:
+        data: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return data
+    return json.dumps(obj, indent=2).encode()
+
+
+def is_commit_sha(ref: str) -> bool:
+    """Check whether a ref is an (immutable) commit hash, rather than a branch.
+
+    Only full hashes count, as servers refuse to fetch abbreviated ones.
+    """
+    return re.fullmatch(r"[0-9a-f]{40}|[0-9a-f]{64}", ref) is not None
+
+
+def wait_for_exit(process: subprocess.Popen[Any], timeout: float | None) -> int:
+    """Wait for a process to exit, without polling where the OS allows it.
+
+    `Popen.wait()` with a timeout polls the process in a sleep loop. On Linux
+    a pidfd becomes readable as soon as the process exits, so we can sleep on
+    that in a single `select()` call instead.
+    """
+    if timeout is None or not hasattr(os, "pidfd_open"):
+        return process.wait(timeout)
+
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except OSError:
+        # Unsupported by the kernel, or the process has already been reaped
+        return process.wait(timeout)
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ)
+            if not selector.select(timeout):
+                raise subprocess.TimeoutExpired(process.args, timeout)
+    finally:
+        os.close(pidfd)
+
+    return process.wait()
+
+
+def kill_process_group(process: subprocess.Popen[Any]) -> None:
+    """Kill a process started with `start_new_session=True`, and its children.
+
+    Killing just the process would leave behind any workers it started, like
+    the validator's `--jobs` pool, still holding its stdout pipe open.
+    """
+    if sys.platform == "win32":
+        process.kill()
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        # Everything in the group has already exited
+        pass
+
+
+def log_process_output(
+    logger: logging.Logger,
+    process: subprocess.CompletedProcess[Any] | subprocess.CalledProcessError,
 ) -> None:
-    """Restore primer.py and primer.json from temp location."""
-    # Ensure directories exist (in case old commit doesn't have them)
-    primer_script.parent.mkdir(parents=True, exist_ok=True)
-    primer_config.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(temp_script, primer_script)
-    shutil.copy2(temp_config, primer_config)
+    """Log the exit code and any captured output of a finished subprocess."""
+    if process.returncode != 0:
+        logger.debug(f"Command failed with exit code {process.returncode}")
+
+    for name, output in (("stdout", process.stdout), ("stderr", process.stderr)):
+        if not output:
+            continue
+        if isinstance(output, bytes):
+            output = output.decode(errors="replace")
+        logger.debug(f"{name}: {output}")
+
+
+def iter_validation_output(stdout: IO[bytes]) -> Iterator[dict[str, str]]:
+    """Parse `pytokens --validate --json` output as it is being read.
+
+    The validator prints one JSON object per line. Older versions of pytokens
+    (which may be checked out as the base commit) print a single JSON array.
+    Lines are parsed straight from bytes, which saves decoding them first.
+    """
+    first_line = stdout.readline()
+    # An empty array is printed as the single line `[]`
+    if first_line.lstrip().startswith(b"["):
+        yield from json_loads(first_line + stdout.read())
+        return
+
+    for line in itertools.chain([first_line], stdout):
+        if not line.endswith(b"\n") and line.strip():
+            # Every result is printed on a line of its own, so this was cut off
+            raise EOFError("Validator output ends partway through a result")
+        if line.strip():
+            yield json_loads(line)
 
 
 @dataclass
@@ -45,7 +169,34 @@ class ValidationResult:
     success_count: int
     skip_count: int
     failure_count: int
-    failed_files: list[str]
+    failed_files: tuple[str, ...]
+    failed_set: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.failed_set = frozenset(self.failed_files)
+
+    def to_json(self) -> dict[str, Any]:
+        """Convert to a JSON serializable dict."""
+        return {
+            "repo_name": self.repo_name,
+            "total_files": self.total_files,
+            "success_count": self.success_count,
+            "skip_count": self.skip_count,
+            "failure_count": self.failure_count,
+            "failed_files": self.failed_files,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> ValidationResult:
+        """Create a result from a dict made by `to_json()`."""
+        return cls(
+            repo_name=data["repo_name"],
+            total_files=data["total_files"],
+            success_count=data["success_count"],
+            skip_count=data["skip_count"],
+            failure_count=data["failure_count"],
+            failed_files=tuple(map(sys.intern, data["failed_files"])),
+        )
 
 
 @dataclass
@@ -53,10 +204,10 @@ class ComparisonResult:
     """Result of comparing two validation runs."""
 
     repo_name: str
-    base_failures: set[str]
-    pr_failures: set[str]
-    new_failures: set[str]
-    fixed_failures: set[str]
+    base_failures: frozenset[str]
+    pr_failures: frozenset[str]
+    new_failures: frozenset[str]
+    fixed_failures: frozenset[str]
     base_stats: ValidationResult
     pr_stats: ValidationResult
 
@@ -64,19 +215,32 @@ class ComparisonResult:
 class PrimerRunner:
     """Runs primer validation and comparison."""
 
-    def __init__(self, config_path: Path, workspace_dir: Path, debug: bool = False):
-        """Initialize primer runner."""
+    def __init__(
+        self,
+        config_path: Path,
+        workspace_dir: Path,
+        debug: bool = False,
+        jobs: int | None = None,
+        use_cache: bool = True,
+    ):
+        """Initialize primer runner.
+
+        `jobs` overrides the `parallelism` setting from the config file.
+        """
         self.debug = debug
+        self.use_cache = use_cache
         self.logger = logging.getLogger(__name__)
 
         self.config_path = config_path
         self.workspace_dir = workspace_dir
         self.repos_dir = workspace_dir / "repos"
         self.results_dir = workspace_dir / "results"
+        self.venvs_dir = workspace_dir / "venvs"
 
         # Create directories
         self.repos_dir.mkdir(parents=True, exist_ok=True)
         self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.venvs_dir.mkdir(parents=True, exist_ok=True)
 
         # Load configuration
         with open(config_path) as f:
@@ -92,6 +256,24 @@ class PrimerRunner:
         ]
         self.settings = config_data.get("settings", {})
         self.timeout = self.settings.get("timeout_per_repo", 300)
+        if jobs is None:
+            jobs = self.settings.get("parallelism", os.cpu_count() or 1)
+        self.parallelism = max(1, jobs)
+
+        self.validator_jobs = self._split_cpus(concurrent_commits=1)
+        # Python executables whose pytokens version doesn't support --jobs
+        self._no_jobs_support: set[str] = set()
+
+        # Maps commit hash refs to their full resolved hashes
+        self._sha_cache: dict[str, str] = {}
+        # Maps pytokens refs given on the command line to commit hashes
+        self._ref_cache: dict[str, str] = {}
+        self._repo_paths = {
+            repo.name: self.repos_dir / repo.name for repo in self.repositories
+        }
+        # Repositories that have already been cloned or updated in this run
+        self._prepared_repos: dict[str, Path] = {}
+        self._repo_locks = {repo.name: threading.Lock() for repo in self.repositories}
 
         # Debug logging for initialization
         self.logger.debug(f"Loaded configuration from {config_path}")
@@ -100,87 +282,219 @@ class PrimerRunner:
         for repo in self.repositories:
             self.logger.debug(f"  - {repo.name} ({repo.ref})")
         self.logger.debug(f"Timeout per repo: {self.timeout}s")
+        self.logger.debug(f"Parallelism: {self.parallelism}")
+        self.logger.debug(f"Validator jobs per repo: {self.validator_jobs}")
+
+    def _split_cpus(self, concurrent_commits: int) -> int:
+        """Work out how many validator jobs each repository gets.
 
-    def _run_subprocess(
+        The CPUs are split between all the repositories being validated at
+        once, across every pytokens commit that is being run at the same time.
+        """
+        concurrent_repos = max(1, min(self.parallelism, len(self.repositories)))
+        concurrent_validators = concurrent_repos * concurrent_commits
+        return max(1, (os.cpu_count() or 1) // concurrent_validators)
+
+    def _run_quick(
         self,
         cmd: list[str],
         env: dict[str, str] | None = None,
         description: str = "",
+        discard_stdout: bool = False,
         **kwargs: Any,
     ) -> subprocess.CompletedProcess[Any]:
-        """Run subprocess with debug-aware output handling."""
+        """Run a short subprocess (e.g. git) with debug-aware output handling.
+
+        Use `discard_stdout` for commands whose output is only of interest
+        when debugging, like progress from git or pip.
+        """
         cmd_str = " ".join(cmd)
         self.logger.debug(f"Running: {cmd_str}")
         if description:
             self.logger.debug(f"Purpose: {description}")
 
-        # Always run the subprocess with capture if it was requested
-        if "capture_output" not in kwargs:
+        if discard_stdout and not self.logger.isEnabledFor(logging.DEBUG):
+            # Nothing reads the output outside of debug logs, but keep stderr
+            # around for the error that is raised if the command fails.
+            kwargs["stdout"] = subprocess.DEVNULL
+            kwargs.setdefault("stderr", subprocess.PIPE)
+        elif "capture_output" not in kwargs:
             kwargs["capture_output"] = True
 
         # Run the subprocess
         try:
             result = subprocess.run(cmd, env=env, **kwargs)
         except subprocess.CalledProcessError as e:
-            # If debug mode and command failed, log the output before re-raising
-            if self.debug:
-                self.logger.debug(f"Command failed with exit code {e.returncode}")
-                if hasattr(e, "stdout") and e.stdout:
-                    self.logger.debug(
-                        f"stdout: {e.stdout if isinstance(e.stdout, str) else e.stdout.decode()}"
-                    )
-                if hasattr(e, "stderr") and e.stderr:
-                    self.logger.debug(
-                        f"stderr: {e.stderr if isinstance(e.stderr, str) else e.stderr.decode()}"
-                    )
+            # Log the output of the failed command before re-raising
+            if self.logger.isEnabledFor(logging.DEBUG):
+                log_process_output(self.logger, e)
             raise
 
-        # In debug mode, log the captured output
-        if self.debug:
-            if result.returncode != 0:
-                self.logger.debug(f"Command failed with exit code {result.returncode}")
-            if hasattr(result, "stdout") and result.stdout:
-                self.logger.debug(
-                    f"stdout: {result.stdout if isinstance(result.stdout, str) else result.stdout.decode()}"
-                )
-            if hasattr(result, "stderr") and result.stderr:
-                self.logger.debug(
-                    f"stderr: {result.stderr if isinstance(result.stderr, str) else result.stderr.decode()}"
-                )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            log_process_output(self.logger, result)
 
         return result
 
-    def clone_or_update_repo(self, repo: Repository) -> Path:
-        """Clone repository or update if it already exists."""
-        repo_path = self.repos_dir / repo.name
+    @contextlib.contextmanager
+    def _run_streaming(
+        self,
+        cmd: list[str],
+        env: dict[str, str] | None = None,
+        description: str = "",
+        timeout: float | None = None,
+    ) -> Iterator[tuple[subprocess.Popen[bytes], IO[bytes]]]:
+        """Run a long subprocess whose stdout is consumed line by line.
+
+        Yields the process along with the file its stderr is spooled to, so
+        that stderr can never fill up a pipe while stdout is being read.
+        Both are left as bytes, for the caller to decode as it sees fit. The
+        process is killed if it doesn't finish within `timeout` seconds.
+        """
+        cmd_str = " ".join(cmd)
+        self.logger.debug(f"Running: {cmd_str}")
+        if description:
+            self.logger.debug(f"Purpose: {description}")
+
+        with tempfile.TemporaryFile("w+b") as stderr_file, subprocess.Popen(
+            cmd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            bufsize=-1,
+            # So that the whole process group can be killed on timeout
+            start_new_session=True,
+        ) as process:
+            timed_out = threading.Event()
+
+            def kill_on_timeout() -> None:
+                assert timeout is not None
+                # Wait in growing slices, so that long runs show up in the logs.
+                # The wait still wakes up as soon as the process exits.
+                start = time.monotonic()
+                deadline = start + timeout
+                interval = 0.01
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out.set()
+                        kill_process_group(process)
+                        return
+                    try:
+                        wait_for_exit(process, min(interval, remaining))
+                    except subprocess.TimeoutExpired:
+                        elapsed = time.monotonic() - start
+                        if elapsed >= 1:
+                            self.logger.debug(
+                                f"Still running after {elapsed:.0f}s: {cmd_str}"
+                            )
+                        interval = min(interval * 2, MAX_POLL_INTERVAL)
+                    else:
+                        # Anything the process left behind could still be
+                        # holding stdout open, which would block the reader
+                        kill_process_group(process)
+                        return
+
+            watcher = None
+            if timeout is not None:
+                watcher = threading.Thread(target=kill_on_timeout, daemon=True)
+                watcher.start()
 
-        if repo_path.exists():
-            self.logger.debug(
-                f"Repository {repo.name} exists at {repo_path}, updating..."
-            )
-            print(f"Updating {repo.name}...")
             try:
-                self._run_subprocess(
-                    ["git", "fetch", "origin"],
-                    description=f"Fetching updates for {repo.name}",
-                    cwd=repo_path,
-                    check=True,
-                    timeout=self.timeout,
-                )
-            except subprocess.CalledProcessError as e:
-                print(f"Warning: Failed to update {repo.name}: {e}")
-                return repo_path
-        else:
+                yield process, stderr_file
+            finally:
+                # Don't leave the process, or anything it started, running if
+                # the caller bailed early
+                kill_process_group(process)
+                process.wait()
+                if watcher is not None:
+                    watcher.join()
+
+                # In debug mode, log the exit code and captured stderr
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    stderr_file.seek(0)
+                    log_process_output(
+                        self.logger,
+                        subprocess.CompletedProcess(
+                            cmd, process.returncode, stderr=stderr_file.read()
+                        ),
+                    )
+
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(cmd, timeout or 0)
+
+    def _resolve_commit(self, repo_path: Path, rev: str) -> str | None:
+        """Resolve a revision to a full commit hash in a local repo, if it exists."""
+        result = self._run_quick(
+            ["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+            description=f"Resolving {rev}",
+            cwd=repo_path,
+            text=True,
+            check=False,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            return None
+        return str(result.stdout.strip())
+
+    def _head_commit(self, repo_path: Path) -> str | None:
+        """Get the commit hash a repo's HEAD points at.
+
+        Primer checkouts are always on a detached HEAD, which git stores as a
+        plain commit hash in the HEAD file. Reading that directly saves
+        spawning git, which is only needed for anything else (like branches).
+        """
+        git_dir = repo_path / ".git"
+        try:
+            if git_dir.is_file():
+                # In a worktree, `.git` is a file pointing to the actual git dir
+                _, _, pointer = git_dir.read_text().partition("gitdir:")
+                git_dir = repo_path / pointer.strip()
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            head = ""
+        if re.fullmatch(r"[0-9a-f]{40}|[0-9a-f]{64}", head):
+            return head
+        return self._resolve_commit(repo_path, "HEAD")
+
+    def _is_checked_out_at(self, repo_path: Path, ref: str) -> bool:
+        """Check if a repo's HEAD already points at the given commit hash."""
+        target_sha = self._sha_cache.get(ref)
+        if target_sha is None:
+            target_sha = self._resolve_commit(repo_path, ref)
+            if target_sha is None:
+                return False
+            self._sha_cache[ref] = target_sha
+
+        return self._head_commit(repo_path) == target_sha
+
+    def clone_or_update_repo(self, repo: Repository) -> Path:
+        """Clone repository or update if it already exists."""
+        repo_path = self._repo_paths[repo.name]
+
+        # Commit hashes are immutable, so there's nothing to update if the
+        # repo is already checked out at the commit.
+        if (
+            repo_path.exists()
+            and is_commit_sha(repo.ref)
+            and self._is_checked_out_at(repo_path, repo.ref)
+        ):
+            self.logger.debug(f"{repo.name} is already at {repo.ref}, skipping update")
+            return repo_path
+
+        if not repo_path.exists() and not is_commit_sha(repo.ref):
+            # A shallow clone of a branch or tag leaves it checked out already
             self.logger.debug(
                 f"Repository {repo.name} not found, cloning from {repo.url}"
             )
             print(f"Cloning {repo.name}...")
             try:
-                self._run_subprocess(
+                self._run_quick(
                     [
                         "git",
                         "clone",
+                        "--filter=blob:none",
                         "--depth=1",
+                        "--single-branch",
                         "--branch",
                         repo.ref,
                         repo.url,
@@ -188,104 +502,252 @@ class PrimerRunner:
                     ],
                     description=f"Cloning {repo.name}",
                     check=True,
+                    discard_stdout=True,
                     timeout=self.timeout,
                 )
             except subprocess.CalledProcessError as e:
                 print(f"Error: Failed to clone {repo.name}: {e}")
                 raise
+            return repo_path
 
-        # Checkout the specified ref
-        self.logger.debug(f"Checking out ref {repo.ref} for {repo.name}")
+        is_new_repo = not repo_path.exists()
+        if not is_new_repo:
+            self.logger.debug(
+                f"Repository {repo.name} exists at {repo_path}, updating..."
+            )
+            print(f"Updating {repo.name}...")
+        else:
+            # `git clone --branch` doesn't accept commit hashes, so we start
+            # from an empty repo and fetch the commit into it.
+            self.logger.debug(
+                f"Repository {repo.name} not found, fetching {repo.ref} from {repo.url}"
+            )
+            print(f"Cloning {repo.name}...")
+            try:
+                self._run_quick(
+                    ["git", "init", "--quiet", str(repo_path)],
+                    description=f"Creating {repo.name}",
+                    check=True,
+                    discard_stdout=True,
+                )
+                self._run_quick(
+                    ["git", "remote", "add", "origin", repo.url],
+                    description=f"Adding remote for {repo.name}",
+                    cwd=repo_path,
+                    check=True,
+                    discard_stdout=True,
+                )
+            except subprocess.CalledProcessError as e:
+                print(f"Error: Failed to clone {repo.name}: {e}")
+                shutil.rmtree(repo_path, ignore_errors=True)
+                raise
+
+        # Fetch just the ref and check it out, which works the same for branches,
+        # tags and commit hashes.
         try:
-            self._run_subprocess(
-                ["git", "checkout", repo.ref],
-                description=f"Checking out {repo.ref}",
+            self._run_quick(
+                [
+                    "git",
+                    "-c",
+                    "protocol.version=2",
+                    "fetch",
+                    "--filter=blob:none",
+                    "--depth=1",
+                    "origin",
+                    repo.ref,
+                ],
+                description=f"Fetching {repo.ref} for {repo.name}",
                 cwd=repo_path,
                 check=True,
-                timeout=30,
+                discard_stdout=True,
+                timeout=self.timeout,
             )
-            self._run_subprocess(
-                ["git", "pull"],
-                description="Pulling latest changes",
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            if is_new_repo:
+                # Don't leave an empty repo behind, it would validate as 0 files
+                print(f"Error: Failed to clone {repo.name}: {e}")
+                shutil.rmtree(repo_path, ignore_errors=True)
+                raise
+            if isinstance(e, subprocess.TimeoutExpired):
+                raise
+            print(f"Warning: Failed to update {repo.name}: {e}")
+            return repo_path
+
+        self.logger.debug(f"Checking out ref {repo.ref} for {repo.name}")
+        try:
+            self._run_quick(
+                ["git", "checkout", "--detach", "FETCH_HEAD"],
+                description=f"Checking out {repo.ref}",
                 cwd=repo_path,
                 check=True,
-                timeout=self.timeout,
+                discard_stdout=True,
+                timeout=30,
             )
             self.logger.debug(f"Successfully checked out {repo.ref}")
         except subprocess.CalledProcessError as e:
+            if is_new_repo:
+                print(f"Error: Failed to checkout {repo.ref} in {repo.name}: {e}")
+                shutil.rmtree(repo_path, ignore_errors=True)
+                raise
             print(f"Warning: Failed to checkout {repo.ref} in {repo.name}: {e}")
 
         return repo_path
 
-    def run_validation(self, repo: Repository) -> ValidationResult:
-        """Run pytokens validation on a repository."""
+    def prepare_repo(self, repo: Repository) -> Path:
+        """Clone or update a repository, only once per primer run.
+
+        Concurrent primer runs for different commits share the repositories,
+        so they all get validated against the exact same checkout.
+        """
+        with self._repo_locks[repo.name]:
+            repo_path = self._prepared_repos.get(repo.name)
+            if repo_path is None:
+                repo_path = self.clone_or_update_repo(repo)
+                self._prepared_repos[repo.name] = repo_path
+
+            return repo_path
+
+    def prepare_all_repos(self) -> None:
+        """Clone or update all repositories at once.
+
+        This is network bound rather than CPU bound, so unlike validation it
+        isn't limited by the `parallelism` setting. Any failure here is left
+        for `run_validation` to retry and report.
+        """
+        self.logger.debug("Cloning and updating all repositories")
+        max_workers = max(1, min(MAX_CONCURRENT_CLONES, len(self.repositories)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.prepare_repo, repo): repo
+                for repo in self.repositories
+            }
+            for future in as_completed(futures):
+                exception = future.exception()
+                if exception is not None:
+                    repo = futures[future]
+                    self.logger.debug(f"Failed to prepare {repo.name}: {exception}")
+
+    def run_validation(
+        self,
+        repo: Repository,
+        python_executable: str | None = None,
+        env: dict[str, str] | None = None,
+        commit_hash: str | None = None,
+    ) -> ValidationResult:
+        """Run pytokens validation on a repository.
+
+        If `commit_hash` is the pytokens commit being validated, results are
+        cached for that commit and the repo's current commit.
+        """
+        if python_executable is None:
+            python_executable = sys.executable
+
         self.logger.debug(f"Starting validation for {repo.name}")
         print(f"Validating {repo.name}...")
 
-        repo_path = self.clone_or_update_repo(repo)
-
-        # Run pytokens validator with JSON output
-        result = None
+        repo_path = self.prepare_repo(repo)
+
+        cache_file = None
+        if commit_hash is not None and self.use_cache:
+            repo_sha = self._head_commit(repo_path)
+            if repo_sha is not None:
+                cache_key = f"{commit_hash}-{PYTHON_TAG}-{repo.name}-{repo_sha}"
+                cache_file = self.results_dir / f"cache-{cache_key}.json"
+                cached_result = self._load_cached_result(cache_file)
+                if cached_result is not None:
+                    print(f"Using cached results for {repo.name}")
+                    return cached_result
+
+        # Older versions of pytokens can't validate files in parallel
+        jobs_args = []
+        if self.validator_jobs > 1 and python_executable not in self._no_jobs_support:
+            jobs_args = ["--jobs", str(self.validator_jobs)]
+
+        # Run pytokens validator with JSON output, parsing it as it streams in
+        retry_without_jobs = False
         try:
-            result = self._run_subprocess(
+            with self._run_streaming(
                 [
-                    sys.executable,
+                    python_executable,
                     "-m",
                     "pytokens",
                     "--validate",
                     "--json",
+                    *jobs_args,
                     str(repo_path),
                 ],
+                env=env,
                 description=f"Running pytokens validation on {repo.name}",
-                capture_output=True,
-                text=True,
                 timeout=self.timeout,
-                check=False,  # Don't raise on non-zero exit
-            )
-
-            # Parse JSON output
-            self.logger.debug(f"Parsing validation output for {repo.name}")
-            if not result.stdout.strip():
-                print(f"Error: No output from validator for {repo.name}")
-                print(f"stderr: {result.stderr}")
-                print(f"returncode: {result.returncode}")
-                return ValidationResult(
-                    repo_name=repo.name,
-                    total_files=0,
-                    success_count=0,
-                    skip_count=0,
-                    failure_count=0,
-                    failed_files=[],
-                )
-
-            validation_data = json.loads(result.stdout)
-
-            # Count results
-            success_count = sum(
-                1 for item in validation_data if item["status"] == "SUCCESS"
-            )
-            skip_count = sum(1 for item in validation_data if item["status"] == "SKIP")
-            failure_count = sum(
-                1 for item in validation_data if item["status"] == "FAILURE"
-            )
-            failed_files = [
-                item["filepath"]
-                for item in validation_data
-                if item["status"] == "FAILURE"
-            ]
+            ) as (process, stderr_file):
+                assert process.stdout is not None
+                self.logger.debug(f"Parsing validation output for {repo.name}")
+
+                # Count results in a single pass
+                status_counts: Counter[str] = Counter()
+                failed_files: list[str] = []
+                output_complete = True
+                try:
+                    for item in iter_validation_output(process.stdout):
+                        status = item["status"]
+                        status_counts[status] += 1
+                        if status == "FAILURE":
+                            # Interned, so that base and PR sets share the strings
+                            failed_files.append(sys.intern(item["filepath"]))
+                except EOFError:
+                    output_complete = False
+
+                total_files = sum(status_counts.values())
+                success_count = status_counts["SUCCESS"]
+                skip_count = status_counts["SKIP"]
+                failure_count = status_counts["FAILURE"]
+
+                process.wait()
+                # A validator that crashed partway through leaves out the rest
+                # of the files, which would hide any regressions in them
+                if process.returncode != 0 or not output_complete:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode(errors="replace")
+                    if (
+                        total_files == 0
+                        and jobs_args
+                        and "unrecognized arguments: --jobs" in stderr
+                    ):
+                        retry_without_jobs = True
+                    else:
+                        if total_files == 0:
+                            print(f"Error: No output from validator for {repo.name}")
+                        else:
+                            print(
+                                f"Error: Validator stopped after {total_files} files for {repo.name}"
+                            )
+                        print(f"stderr: {stderr}")
+                        print(f"returncode: {process.returncode}")
+                        raise ChildProcessError(
+                            f"Validator didn't finish (exit code {process.returncode})"
+                        )
+
+            if retry_without_jobs:
+                self.logger.debug(f"{python_executable} doesn't support --jobs")
+                self._no_jobs_support.add(python_executable)
+                return self.run_validation(repo, python_executable, env, commit_hash)
 
             self.logger.debug(
                 f"Validation complete for {repo.name}: {success_count} passed, {failure_count} failed, {skip_count} skipped"
             )
 
-            return ValidationResult(
+            result = ValidationResult(
                 repo_name=repo.name,
-                total_files=len(validation_data),
+                total_files=total_files,
                 success_count=success_count,
                 skip_count=skip_count,
                 failure_count=failure_count,
-                failed_files=failed_files,
+                failed_files=tuple(failed_files),
             )
+            # Only complete runs get this far, failed ones are retried next time
+            if cache_file is not None:
+                self._save_cached_result(cache_file, result)
+            return result
 
         except subprocess.TimeoutExpired:
             self.logger.debug(f"Validation timeout for {repo.name}")
@@ -296,16 +758,15 @@ class PrimerRunner:
                 success_count=0,
                 skip_count=0,
                 failure_count=0,
-                failed_files=[],
+                failed_files=(),
             )
         except json.JSONDecodeError as e:
             self.logger.debug(f"JSON parse error for {repo.name}: {e}")
             print(f"\n{'='*80}")
             print(f"FATAL ERROR: Failed to parse JSON validation output for {repo.name}")
             print(f"JSON Error: {e}")
-            if result:
-                print(f"\nFirst 1000 characters of output:")
-                print(f"{result.stdout[:1000]}")
+            print(f"\nFirst 1000 characters of the offending output:")
+            print(f"{e.doc[:1000]}")
             print(f"\nThis indicates pytokens is printing non-JSON content to stdout.")
             print(f"Check that --json mode properly suppresses all diagnostic output.")
             print(f"{'='*80}\n")
@@ -314,28 +775,67 @@ class PrimerRunner:
                 f"Validation output is contaminated with non-JSON content."
             )
 
-    def run_all_validations(self) -> list[ValidationResult]:
-        """Run validation on all configured repositories."""
+    def _load_cached_result(self, cache_file: Path) -> ValidationResult | None:
+        """Load a cached validation result, if there is a readable one."""
+        try:
+            data = json_loads(cache_file.read_bytes())
+            return ValidationResult.from_json(data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.debug(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return None
+
+    def _save_cached_result(self, cache_file: Path, result: ValidationResult) -> None:
+        """Save a validation result to the cache."""
+        # Write to a temporary file first, so a partly written cache is never read
+        temp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}")
+        temp_file.write_bytes(json_dumps_pretty(result.to_json()))
+        os.replace(temp_file, cache_file)
+
+    def run_all_validations(
+        self,
+        python_executable: str | None = None,
+        env: dict[str, str] | None = None,
+        commit_hash: str | None = None,
+    ) -> list[ValidationResult]:
+        """Run validation on all configured repositories in parallel."""
+        self.prepare_all_repos()
+
         self.logger.debug("Starting validation suite for all repositories")
-        results: list[ValidationResult] = []
-        for i, repo in enumerate(self.repositories):
-            try:
+        results: dict[str, ValidationResult] = {}
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            futures: dict[Future[ValidationResult], Repository] = {
+                executor.submit(
+                    self.run_validation, repo, python_executable, env, commit_hash
+                ): repo
+                for repo in self.repositories
+            }
+            for i, future in enumerate(as_completed(futures)):
+                repo = futures[future]
                 self.logger.debug(
-                    f"Processing repository {repo.name} ({i+1}/{len(self.repositories)})"
+                    f"Finished repository {repo.name} ({i+1}/{len(self.repositories)})"
                 )
-                result = self.run_validation(repo)
-                results.append(result)
-            except RuntimeError:
-                # RuntimeError indicates a fatal error (e.g., JSON parsing failure)
-                # Re-raise to fail the entire primer run
-                raise
-            except Exception as e:
-                self.logger.debug(f"Exception during validation: {e}", exc_info=True)
-                print(f"Error validating {repo.name}: {e}")
-                # Continue with other repos for non-fatal errors
-                continue
+                try:
+                    results[repo.name] = future.result()
+                except RuntimeError:
+                    # RuntimeError indicates a fatal error (e.g., JSON parsing failure)
+                    # Cancel pending repos and re-raise to fail the entire primer run
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                except Exception as e:
+                    self.logger.debug(
+                        f"Exception during validation: {e}", exc_info=True
+                    )
+                    print(f"Error validating {repo.name}: {e}")
+                    # Continue with other repos for non-fatal errors
+                    continue
 
-        return results
+        # Keep the results in the same order as the configuration
+        return [
+            results[repo.name] for repo in self.repositories if repo.name in results
+        ]
 
     def compare_results(
         self,
@@ -347,21 +847,21 @@ class PrimerRunner:
         comparisons: list[ComparisonResult] = []
 
         # Create a dict for easy lookup
-        base_dict = {r.repo_name: r for r in base_results}
         pr_dict = {r.repo_name: r for r in pr_results}
 
-        for repo_name in base_dict.keys() | pr_dict.keys():
-            base_result = base_dict.get(repo_name)
+        # Only repos that have results on both sides can be compared. Going
+        # through the base results keeps the report in config order.
+        for base_result in base_results:
+            repo_name = base_result.repo_name
             pr_result = pr_dict.get(repo_name)
-
-            if not base_result or not pr_result:
+            if pr_result is None:
                 continue
 
-            base_failures = set(base_result.failed_files)
-            pr_failures = set(pr_result.failed_files)
+            base_failures = base_result.failed_set
+            pr_failures = pr_result.failed_set
 
-            new_failures = pr_failures - base_failures
-            fixed_failures = base_failures - pr_failures
+            new_failures = pr_failures.difference(base_failures)
+            fixed_failures = base_failures.difference(pr_failures)
 
             self.logger.debug(
                 f"Comparing {repo_name}: {len(new_failures)} new, {len(fixed_failures)} fixed"
@@ -383,7 +883,9 @@ class PrimerRunner:
 
     def generate_report(self, comparisons: list[ComparisonResult]) -> str:
         """Generate markdown report from comparison results."""
-        lines = ["# Pytokens Primer Report", ""]
+        report = io.StringIO()
+        write = report.write
+        write("# Pytokens Primer Report\n\n")
 
         # Summary
         total_repos = len(comparisons)
@@ -391,41 +893,35 @@ class PrimerRunner:
         repos_with_improvements = sum(1 for c in comparisons if c.fixed_failures)
         repos_unchanged = total_repos - repos_with_regressions - repos_with_improvements
 
-        lines.extend(
-            [
-                "## Summary",
-                f"- Repositories tested: {total_repos}",
-                f"- Repositories with regressions: {repos_with_regressions} {'❌' if repos_with_regressions > 0 else ''}",
-                f"- Repositories with improvements: {repos_with_improvements} {'✅' if repos_with_improvements > 0 else ''}",
-                f"- Repositories unchanged: {repos_unchanged}",
-                "",
-            ]
+        write(
+            "## Summary\n"
+            f"- Repositories tested: {total_repos}\n"
+            f"- Repositories with regressions: {repos_with_regressions} {'❌' if repos_with_regressions > 0 else ''}\n"
+            f"- Repositories with improvements: {repos_with_improvements} {'✅' if repos_with_improvements > 0 else ''}\n"
+            f"- Repositories unchanged: {repos_unchanged}\n"
+            "\n"
         )
 
         # Regressions section
         regressions = [c for c in comparisons if c.new_failures]
         if regressions:
-            lines.extend(["## Regressions", ""])
+            write("## Regressions\n\n")
             for comp in regressions:
-                lines.extend(
-                    [
-                        f"### {comp.repo_name}",
-                        f"**New failures: {len(comp.new_failures)} files**",
-                        "",
-                    ]
+                write(
+                    f"### {comp.repo_name}\n"
+                    f"**New failures: {len(comp.new_failures)} files**\n"
+                    "\n"
                 )
                 for filepath in sorted(comp.new_failures):
-                    lines.append(f"- {filepath}")
-                lines.extend(
-                    [
-                        "",
-                        f"**Stats**: {comp.pr_stats.success_count} passed, "
-                        f"{comp.pr_stats.failure_count} failed (+{len(comp.new_failures)}), "
-                        f"{comp.pr_stats.skip_count} skipped",
-                        "",
-                        "---",
-                        "",
-                    ]
+                    write(f"- {filepath}\n")
+                write(
+                    "\n"
+                    f"**Stats**: {comp.pr_stats.success_count} passed, "
+                    f"{comp.pr_stats.failure_count} failed (+{len(comp.new_failures)}), "
+                    f"{comp.pr_stats.skip_count} skipped\n"
+                    "\n"
+                    "---\n"
+                    "\n"
                 )
 
         # Improvements section
@@ -433,136 +929,240 @@ class PrimerRunner:
             c for c in comparisons if c.fixed_failures and not c.new_failures
         ]
         if improvements:
-            lines.extend(["## Improvements", ""])
+            write("## Improvements\n\n")
             for comp in improvements:
-                lines.extend(
-                    [
-                        f"### {comp.repo_name}",
-                        f"**Fixed: {len(comp.fixed_failures)} files**",
-                        "",
-                    ]
+                write(
+                    f"### {comp.repo_name}\n"
+                    f"**Fixed: {len(comp.fixed_failures)} files**\n"
+                    "\n"
                 )
                 for filepath in sorted(comp.fixed_failures):
-                    lines.append(f"- {filepath}")
-                lines.extend(
-                    [
-                        "",
-                        f"**Stats**: {comp.pr_stats.success_count} passed (+{len(comp.fixed_failures)}), "
-                        f"{comp.pr_stats.failure_count} failed, "
-                        f"{comp.pr_stats.skip_count} skipped",
-                        "",
-                        "---",
-                        "",
-                    ]
+                    write(f"- {filepath}\n")
+                write(
+                    "\n"
+                    f"**Stats**: {comp.pr_stats.success_count} passed (+{len(comp.fixed_failures)}), "
+                    f"{comp.pr_stats.failure_count} failed, "
+                    f"{comp.pr_stats.skip_count} skipped\n"
+                    "\n"
+                    "---\n"
+                    "\n"
                 )
 
         # Conclusion
-        lines.extend(["## Conclusion", ""])
+        write("## Conclusion\n\n")
         if repos_with_regressions > 0:
             total_new_failures = sum(len(c.new_failures) for c in regressions)
-            lines.append(
-                f"❌ **Regressions detected** - {total_new_failures} new failures"
-            )
+            write(f"❌ **Regressions detected** - {total_new_failures} new failures")
         else:
-            lines.append("✅ **No regressions detected** - Safe to merge!")
+            write("✅ **No regressions detected** - Safe to merge!")
 
-        return "\n".join(lines)
+        return report.getvalue()
 
-    def run_primer_for_commit(
-        self,
-        commit_hash: str,
-        temp_repo_dir: Path,
-        primer_script: Path,
-        primer_config: Path,
-    ) -> list[ValidationResult]:
-        """Run primer on all repos for a specific pytokens commit hash."""
-        self.logger.debug(f"Running primer for commit {commit_hash}")
-        print(f"\n=== Running primer for {commit_hash[:8]} ===\n")
+    def _venv_has_pytokens(self, venv_python: Path) -> bool:
+        """Check if a venv exists and has a working pytokens installed."""
+        if not venv_python.exists():
+            return False
 
-        # Clean any untracked files before checkout
-        self._run_subprocess(
-            ["git", "clean", "-fd"],
-            description="Cleaning untracked files",
-            cwd=temp_repo_dir,
-            check=True,
+        result = self._run_quick(
+            [str(venv_python), "-c", "import pytokens"],
+            description="Checking for an existing pytokens install",
+            cwd=venv_python.parent,
+            check=False,
         )
+        return result.returncode == 0
 
-        # Checkout the commit hash in temp repo (force to overwrite any local changes)
-        self._run_subprocess(
-            ["git", "checkout", "-f", commit_hash],
-            description=f"Checking out commit {commit_hash[:8]}",
-            cwd=temp_repo_dir,
-            check=True,
-        )
+    def _create_venv(
+        self,
+        commit_hash: str,
+        venv_dir: Path,
+        venv_python: Path,
+        source_dir: Path,
+    ) -> None:
+        """Create a fresh venv and install pytokens into it from `source_dir`."""
+        # Clear out any half-built venv left behind by an interrupted run
+        shutil.rmtree(venv_dir, ignore_errors=True)
 
-        # Copy current primer files to temp repo
-        self.logger.debug("Copying current primer files to temp repo")
-        (temp_repo_dir / "scripts").mkdir(exist_ok=True)
-        shutil.copy2(primer_script, temp_repo_dir / "scripts" / "primer.py")
-        shutil.copy2(primer_config, temp_repo_dir / "primer.json")
+        # uv is much faster at creating venvs and installing packages, if available
+        uv = shutil.which("uv")
 
-        # Create a fresh venv for this commit
-        venv_dir = temp_repo_dir.parent / f"venv-{commit_hash[:8]}"
         self.logger.debug(f"Creating fresh venv at {venv_dir}")
         print("Creating fresh virtual environment...")
-        self._run_subprocess(
-            [sys.executable, "-m", "venv", str(venv_dir)],
+        self._run_quick(
+            (
+                [uv, "venv", "--quiet", "--python", sys.executable, str(venv_dir)]
+                if uv is not None
+                else [sys.executable, "-m", "venv", str(venv_dir)]
+            ),
             description=f"Creating venv for {commit_hash[:8]}",
             check=True,
+            discard_stdout=True,
         )
 
-        # Determine the python executable in the new venv
-        if sys.platform == "win32":
-            venv_python = venv_dir / "Scripts" / "python.exe"
-        else:
-            venv_python = venv_dir / "bin" / "python"
-
-        # Install pytokens from temp repo into fresh venv
+        # Install pytokens from the given checkout. It is not installed in
+        # editable mode, so the venv keeps working after the checkout is gone.
         print("Installing pytokens in fresh environment...")
-        self._run_subprocess(
-            [str(venv_python), "-m", "pip", "install", "-e", str(temp_repo_dir), "-q"],
-            env={**os.environ, "PYTOKENS_USE_MYPYC": "0"},
+        self._run_quick(
+            (
+                [uv, "pip", "install", "--quiet", "--python", str(venv_python)]
+                if uv is not None
+                else [str(venv_python), "-m", "pip", "install", "-q"]
+            )
+            + ["--no-deps", str(source_dir)],
+            env={
+                **os.environ,
+                "PYTOKENS_USE_MYPYC": "0",
+                "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+                "PIP_NO_INPUT": "1",
+            },
             description=f"Installing pytokens for {commit_hash[:8]}",
             check=True,
+            discard_stdout=True,
         )
 
-        # Temporarily replace sys.executable to use the venv python for validations
+    def run_primer_for_commit(
+        self,
+        commit_hash: str,
+        temp_repo_dir: Path,
+    ) -> list[ValidationResult]:
+        """Run primer on all repos for a specific pytokens commit hash."""
+        self.logger.debug(f"Running primer for commit {commit_hash}")
+        print(f"\n=== Running primer for {commit_hash[:8]} ===\n")
+
+        # Fresh worktrees are already at the commit, no need to clean or checkout
+        if self._head_commit(temp_repo_dir) != commit_hash:
+            # Clean any untracked files before checkout
+            self._run_quick(
+                ["git", "clean", "-fd"],
+                description="Cleaning untracked files",
+                cwd=temp_repo_dir,
+                check=True,
+                discard_stdout=True,
+            )
+
+            # Checkout the commit (force to overwrite any local changes)
+            self._run_quick(
+                ["git", "checkout", "-f", commit_hash],
+                description=f"Checking out commit {commit_hash[:8]}",
+                cwd=temp_repo_dir,
+                check=True,
+                discard_stdout=True,
+            )
+
+        # Reuse the venv for this commit if an earlier run already set it up
+        venv_dir = self.venvs_dir / f"venv-{commit_hash}-{PYTHON_TAG}"
+        if sys.platform == "win32":
+            venv_bin_dir = venv_dir / "Scripts"
+            venv_python = venv_bin_dir / "python.exe"
+        else:
+            venv_bin_dir = venv_dir / "bin"
+            venv_python = venv_bin_dir / "python"
+
+        if self._venv_has_pytokens(venv_python):
+            self.logger.debug(f"Reusing existing venv at {venv_dir}")
+            print("Reusing existing virtual environment...")
+        else:
+            self._create_venv(commit_hash, venv_dir, venv_python, temp_repo_dir)
+
+        # Pass the venv python and environment down explicitly, so that the
+        # validation workers don't depend on any global state
         self.logger.debug(f"Using venv python: {venv_python}")
-        original_executable = sys.executable
-        sys.executable = str(venv_python)
+        venv_env = {
+            **os.environ,
+            "VIRTUAL_ENV": str(venv_dir),
+            "PATH": f"{venv_bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        }
 
-        try:
-            # Run validations
-            self.logger.debug("Running validations")
-            results = self.run_all_validations()
-        finally:
-            # Restore original sys.executable
-            sys.executable = original_executable
+        # Run validations
+        self.logger.debug("Running validations")
+        results = self.run_all_validations(str(venv_python), venv_env, commit_hash)
 
         # Save results
         self.logger.debug("Validation complete, saving results")
         results_file = self.results_dir / f"results-{commit_hash[:8]}.json"
-        with open(results_file, "w") as f:
-            json.dump(
-                [
-                    {
-                        "repo_name": r.repo_name,
-                        "total_files": r.total_files,
-                        "success_count": r.success_count,
-                        "skip_count": r.skip_count,
-                        "failure_count": r.failure_count,
-                        "failed_files": r.failed_files,
-                    }
-                    for r in results
-                ],
-                f,
-                indent=2,
-            )
+        results_file.write_bytes(json_dumps_pretty([r.to_json() for r in results]))
 
         self.logger.debug(f"Results saved to {results_file}")
         print(f"\nResults saved to {results_file}")
         return results
 
+    def _resolve_ref(self, ref: str) -> str:
+        """Resolve a pytokens ref to a commit hash, memoized for this run."""
+        commit_hash = self._ref_cache.get(ref)
+        if commit_hash is not None:
+            return commit_hash
+
+        # If the ref looks like a remote ref (e.g., origin/main), fetch it first
+        if ref.startswith("origin/"):
+            commit_hash = self._update_remote_branch(ref.split("/", 1)[1])
+
+        if commit_hash is None:
+            commit_hash = str(
+                self._run_quick(
+                    ["git", "rev-parse", ref],
+                    description=f"Resolving {ref} commit hash",
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout.strip()
+            )
+
+        self._ref_cache[ref] = commit_hash
+        return commit_hash
+
+    def _update_remote_branch(self, branch_name: str) -> str | None:
+        """Make sure the latest commit of a remote branch is available locally.
+
+        Returns the branch's commit hash, if it is already available locally.
+        A cheap `git ls-remote` is done first, so that the fetch can be
+        skipped entirely when there are no new commits (e.g. on reruns).
+        """
+        ls_remote = self._run_quick(
+            ["git", "ls-remote", "origin", f"refs/heads/{branch_name}"],
+            description=f"Looking up {branch_name} on origin",
+            text=True,
+            check=False,
+            timeout=self.timeout,
+        )
+        if ls_remote.returncode == 0 and ls_remote.stdout.strip():
+            remote_hash = str(ls_remote.stdout.split()[0])
+            if self._resolve_commit(Path.cwd(), remote_hash) == remote_hash:
+                self.logger.debug(f"{branch_name} is up to date, skipping fetch")
+                return remote_hash
+
+        self.logger.debug(f"Fetching remote branch: {branch_name}")
+        print(f"Fetching {branch_name} from origin...")
+        try:
+            # Fetch with enough depth to ensure we get the commit history
+            # In CI shallow clones, we need to unshallow or fetch with sufficient depth
+            self._run_quick(
+                ["git", "fetch", "--depth=100", "origin", branch_name],
+                description=f"Fetching {branch_name}",
+                check=True,
+                discard_stdout=True,
+            )
+        except subprocess.CalledProcessError as e:
+            self.logger.debug(f"Fetch with depth failed, trying treeless fetch: {e}")
+            try:
+                # If depth fetch fails, fetch the full commit history but
+                # skip downloading trees and blobs, which are fetched lazily.
+                self._run_quick(
+                    ["git", "fetch", "--filter=tree:0", "origin", branch_name],
+                    description=f"Fetching {branch_name} (treeless)",
+                    check=True,
+                    discard_stdout=True,
+                )
+            except subprocess.CalledProcessError:
+                self.logger.debug("Treeless fetch failed, trying simple fetch")
+                # Last resort: simple fetch
+                self._run_quick(
+                    ["git", "fetch", "origin", branch_name],
+                    description=f"Fetching {branch_name} (simple)",
+                    check=False,
+                    discard_stdout=True,
+                )
+
+        return None
+
     def compare_commits(
         self, base_commit: str, pr_commit: str, output_file: Path | None = None
     ) -> int:
@@ -570,120 +1170,71 @@ class PrimerRunner:
         # Get current working directory (the real repo)
         current_dir = Path.cwd()
 
-        # If base_commit looks like a remote ref (e.g., origin/main), fetch it first
-        if "/" in base_commit and base_commit.startswith("origin/"):
-            branch_name = base_commit.split("/", 1)[1]
-            self.logger.debug(f"Fetching remote branch: {branch_name}")
-            print(f"Fetching {branch_name} from origin...")
-            try:
-                # Fetch with enough depth to ensure we get the commit history
-                # In CI shallow clones, we need to unshallow or fetch with sufficient depth
-                self._run_subprocess(
-                    ["git", "fetch", "--depth=100", "origin", branch_name],
-                    description=f"Fetching {branch_name}",
-                    check=True,
-                )
-            except subprocess.CalledProcessError as e:
-                self.logger.debug(f"Fetch with depth failed, trying unshallow: {e}")
-                try:
-                    # If depth fetch fails, try to unshallow
-                    self._run_subprocess(
-                        ["git", "fetch", "--unshallow", "origin"],
-                        description="Unshallowing repository",
-                        check=True,
-                    )
-                except subprocess.CalledProcessError:
-                    self.logger.debug(f"Unshallow also failed, trying simple fetch")
-                    # Last resort: simple fetch
-                    self._run_subprocess(
-                        ["git", "fetch", "origin", branch_name],
-                        description=f"Fetching {branch_name} (simple)",
-                        check=False,
-                    )
-
         # Resolve to commit hashes in current repo
         self.logger.debug(f"Resolving base commit: {base_commit}")
-        base_commit_hash = self._run_subprocess(
-            ["git", "rev-parse", base_commit],
-            description="Resolving base commit hash",
-            capture_output=True,
-            text=True,
-            check=True,
-        ).stdout.strip()
-
+        base_commit_hash = self._resolve_ref(base_commit)
         self.logger.debug(f"Resolving PR commit: {pr_commit}")
-        pr_commit_hash = self._run_subprocess(
-            ["git", "rev-parse", pr_commit],
-            description="Resolving PR commit hash",
-            capture_output=True,
-            text=True,
-            check=True,
-        ).stdout.strip()
+        pr_commit_hash = self._resolve_ref(pr_commit)
 
         self.logger.debug(f"Base: {base_commit_hash}, PR: {pr_commit_hash}")
         print(f"Base commit: {base_commit} -> {base_commit_hash[:8]}")
         print(f"PR commit: {pr_commit} -> {pr_commit_hash[:8]}")
 
-        # Create a temp directory and clone the repo there
+        # Create a temp directory for the worktrees
         self.logger.debug("Creating temp directory for git operations")
         temp_dir = Path(tempfile.mkdtemp())
-        temp_repo_dir = temp_dir / "repo"
-
-        primer_script = Path(__file__)
-        primer_config = self.config_path
 
+        created_worktrees: list[Path] = []
         try:
-            # Get the origin URL from the current repo
-            origin_url_result = self._run_subprocess(
-                ["git", "config", "--get", "remote.origin.url"],
-                description="Getting origin URL",
-                cwd=current_dir,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            origin_url = origin_url_result.stdout.strip() if origin_url_result.returncode == 0 else None
-
-            # Clone the current repo to temp directory
-            self.logger.debug(f"Cloning repo to temp directory: {temp_repo_dir}")
-            print(f"Cloning repo to temporary directory...")
-            self._run_subprocess(
-                ["git", "clone", str(current_dir), str(temp_repo_dir)],
-                description="Cloning repo to temp directory",
-                check=True,
-            )
-
-            # If we have an origin URL, update the temp repo's origin to point to it
-            # and fetch the commits we need from the actual remote
-            if origin_url:
-                self.logger.debug(f"Updating origin URL to: {origin_url}")
-                self._run_subprocess(
-                    ["git", "remote", "set-url", "origin", origin_url],
-                    description="Updating origin URL",
-                    cwd=temp_repo_dir,
+            # Check out each commit into its own worktree of the current repo.
+            # They share its object store, so nothing needs to be cloned or
+            # fetched, and both primer runs can happen at the same time.
+            base_repo_dir = temp_dir / "base"
+            pr_repo_dir = temp_dir / "pr"
+            worktrees = {pr_commit_hash: pr_repo_dir}
+            if base_commit_hash != pr_commit_hash:
+                worktrees[base_commit_hash] = base_repo_dir
+            for commit_hash, worktree_dir in worktrees.items():
+                self._run_quick(
+                    [
+                        "git",
+                        "worktree",
+                        "add",
+                        "--detach",
+                        str(worktree_dir),
+                        commit_hash,
+                    ],
+                    description=f"Creating worktree for {commit_hash[:8]}",
+                    cwd=current_dir,
                     check=True,
+                    discard_stdout=True,
                 )
+                created_worktrees.append(worktree_dir)
 
-                # Fetch enough history to ensure we have both commits
-                # We can't fetch arbitrary commit SHAs, so we fetch all branches
-                self.logger.debug("Fetching all branches from origin")
-                print(f"Fetching branches from origin...")
-                self._run_subprocess(
-                    ["git", "fetch", "origin", "+refs/heads/*:refs/remotes/origin/*"],
-                    description="Fetching all branches",
-                    cwd=temp_repo_dir,
-                    check=True,
+            if base_commit_hash == pr_commit_hash:
+                # Nothing to compare against, a single run will do
+                base_results = pr_results = self.run_primer_for_commit(
+                    pr_commit_hash, pr_repo_dir
                 )
-
-            # Run for base commit
-            base_results = self.run_primer_for_commit(
-                base_commit_hash, temp_repo_dir, primer_script, primer_config
-            )
-
-            # Run for PR commit
-            pr_results = self.run_primer_for_commit(
-                pr_commit_hash, temp_repo_dir, primer_script, primer_config
-            )
+            else:
+                # Run for base and PR commits concurrently, sharing the CPUs
+                self.validator_jobs = self._split_cpus(concurrent_commits=2)
+                self.logger.debug(
+                    f"Validator jobs per repo, per commit: {self.validator_jobs}"
+                )
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    base_future = executor.submit(
+                        self.run_primer_for_commit,
+                        base_commit_hash,
+                        base_repo_dir,
+                    )
+                    pr_future = executor.submit(
+                        self.run_primer_for_commit,
+                        pr_commit_hash,
+                        pr_repo_dir,
+                    )
+                    base_results = base_future.result()
+                    pr_results = pr_future.result()
 
             # Compare
             self.logger.debug("Comparing results between base and PR")
@@ -698,7 +1249,7 @@ class PrimerRunner:
             # Save report if output file specified
             if output_file:
                 print(f"Writing report to {output_file.absolute()}")
-                output_file.write_text(report)
+                output_file.write_bytes(report.encode("utf-8"))
                 print(f"Report saved to {output_file.absolute()}")
                 print(f"File exists: {output_file.exists()}")
             else:
@@ -710,9 +1261,24 @@ class PrimerRunner:
             return 1 if has_regressions else 0
 
         finally:
-            # Clean up temp directory
-            self.logger.debug("Cleaning up temp directory")
+            # Clean up worktrees and temp directory
+            self.logger.debug("Cleaning up worktrees and temp directory")
+            for worktree_dir in created_worktrees:
+                self._run_quick(
+                    ["git", "worktree", "remove", "--force", str(worktree_dir)],
+                    description=f"Removing worktree {worktree_dir}",
+                    cwd=current_dir,
+                    check=False,
+                    discard_stdout=True,
+                )
             shutil.rmtree(temp_dir, ignore_errors=True)
+            self._run_quick(
+                ["git", "worktree", "prune"],
+                description="Pruning stale worktrees",
+                cwd=current_dir,
+                check=False,
+                discard_stdout=True,
+            )
             print(f"Cleaned up temporary directory")
 
 
@@ -736,6 +1302,12 @@ def main() -> int:
         default=".primer-cache",
         help="Workspace directory for repos and results",
     )
+    run_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Number of repositories to validate at once (default: CPU count)",
+    )
 
     # Compare command
     compare_parser = subparsers.add_parser(
@@ -753,6 +1325,17 @@ def main() -> int:
         help="Workspace directory for repos and results",
     )
     compare_parser.add_argument("--output", help="Output file for report (markdown)")
+    compare_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Validate every repo again, instead of reusing cached results",
+    )
+    compare_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Number of repositories to validate at once (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
@@ -770,7 +1353,13 @@ def main() -> int:
         print(f"Error: Config file not found: {config_path}")
         return 1
 
-    runner = PrimerRunner(config_path, workspace_dir, debug=args.debug)
+    runner = PrimerRunner(
+        config_path,
+        workspace_dir,
+        debug=args.debug,
+        jobs=args.jobs,
+        use_cache=not getattr(args, "no_cache", False),
+    )
 
     if args.command == "run":
         results = runner.run_all_validations()
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import enum
+import re
 import string
-from typing import ClassVar, Iterator
+from typing import Callable, Final, Iterator
 
 
 class TokenizeError(Exception): ...
@@ -35,6 +36,69 @@ class NotAnIndent(Exception): ...
 class Underflow(Exception): ...
 
 
+# Characters that need a closer look inside a string literal, by quote.
+# Everything else can be skipped over in bulk. Newlines only matter in
+# single quoted strings, where they end the string with an error.
+STRING_SPECIAL_CHARS = {
+    "'": re.compile(r"['\\\n]"),
+    '"': re.compile(r'["\\\n]'),
+    "'''": re.compile(r"['\\]"),
+    '"""': re.compile(r'["\\]'),
+}
+FSTRING_MIDDLE_SPECIAL_CHARS = {
+    "'": re.compile(r"['{\\\n]"),
+    '"': re.compile(r'["{\\\n]'),
+    "'''": re.compile(r"['{\\]"),
+    '"""': re.compile(r'["{\\]'),
+}
+FSTRING_MODIFIER_SPECIAL_CHARS = re.compile(r"[{}\n]")
+
+
+def char_table(chars: str) -> bytes:
+    """Make a lookup table of which ASCII characters are in `chars`."""
+    return bytes(1 if chr(char_code) in chars else 0 for char_code in range(128))
+
+
+# Digits (and underscores) allowed in non-decimal number literals
+BINARY_DIGITS_TABLE: Final = char_table("01_")
+OCTAL_DIGITS_TABLE: Final = char_table("01234567_")
+HEX_DIGITS_TABLE: Final = char_table(string.hexdigits + "_")
+# ASCII characters allowed in identifiers
+IDENTIFIER_CHARS_TABLE: Final = char_table(string.ascii_letters + string.digits + "_")
+# Whitespace characters, other than line endings
+WHITESPACE_TABLE: Final = char_table(" \r\t\x0b\x0c")
+# Characters a string token can start with: a quote, or a prefix character
+STRING_START_CHARS_TABLE: Final = char_table("'\"bBrRuUfFtT")
+
+
+def case_variants(text: str) -> set[str]:
+    """Return every upper/lower case spelling of `text`."""
+    variants = {""}
+    for char in text:
+        variants = {
+            variant + case
+            for variant in variants
+            for case in (char.lower(), char.upper())
+        }
+    return variants
+
+
+FSTRING_PREFIXES = frozenset(
+    variant
+    for prefix in ("f", "t", "fr", "rf", "tr", "rt")
+    for variant in case_variants(prefix)
+)
+STRING_PREFIXES = FSTRING_PREFIXES | frozenset(
+    variant
+    for prefix in ("", "b", "r", "u", "br", "rb")
+    for variant in case_variants(prefix)
+)
+# Everything a string token can start with: a prefix followed by a quote
+STRING_STARTS = frozenset(
+    prefix + quote for prefix in STRING_PREFIXES for quote in ("'", '"')
+)
+
+
 class TokenType(enum.IntEnum):
     whitespace = 1
     indent = 2
@@ -74,18 +138,28 @@ class TokenType(enum.IntEnum):
         return f"TokenType.{self.name}"
 
     def to_python_token(self) -> str:
-        if self.name == "identifier":
-            return "NAME"
-
-        if self.is_operator():
-            return "OP"
-
-        return self.name.upper()
+        return PYTHON_TOKEN_NAMES[self]
 
     def is_operator(self) -> bool:
         return TokenType._op_start < self < TokenType._op_end
 
 
+def _build_python_token_names() -> list[str]:
+    """List the name the `tokenize` module uses for each token type, by type."""
+    python_token_names = [""] * (max(TokenType) + 1)
+    for token_type in TokenType:
+        if token_type == TokenType.identifier:
+            python_token_names[token_type] = "NAME"
+        elif token_type.is_operator():
+            python_token_names[token_type] = "OP"
+        else:
+            python_token_names[token_type] = token_type.name.upper()
+    return python_token_names
+
+
+PYTHON_TOKEN_NAMES: Final = _build_python_token_names()
+
+
 @dataclass
 class Token:
     type: TokenType
@@ -123,12 +197,12 @@ class Token:
 
 
 class FStringState:
-    not_fstring: ClassVar[int] = 1
-    at_fstring_middle: ClassVar[int] = 2
-    at_fstring_lbrace: ClassVar[int] = 3
-    in_fstring_expr: ClassVar[int] = 4
-    in_fstring_expr_modifier: ClassVar[int] = 5
-    at_fstring_end: ClassVar[int] = 6
+    not_fstring: Final = 1
+    at_fstring_middle: Final = 2
+    at_fstring_lbrace: Final = 3
+    in_fstring_expr: Final = 4
+    in_fstring_expr_modifier: Final = 5
+    at_fstring_end: Final = 6
 
     def __init__(self) -> None:
         self.state = FStringState.not_fstring
@@ -240,19 +314,47 @@ class TokenIterator:
         else:
             self.advance()
 
-    def match(self, *options: str, ignore_case: bool = False) -> bool:
-        for option in options:
-            if self.current_index + len(option) > len(self.source):
-                continue
-            snippet = self.source[self.current_index : self.current_index + len(option)]
-            if ignore_case:
-                option = option.lower()
-                snippet = snippet.lower()
+    def advance_to(self, index: int) -> None:
+        """Advance to `index`, keeping track of any newlines skipped over."""
+        newline_count = self.source.count("\n", self.current_index, index)
+        if newline_count == 0:
+            self.advance_by(index - self.current_index)
+            return
+
+        last_newline_index = self.source.rfind("\n", self.current_index, index)
+        self.next_line()
+        self.line_number += newline_count - 1
+        self.byte_offset = index - (last_newline_index + 1)
+        self.current_index = index
+
+    def advance_over_whitespace(self) -> None:
+        """Advance over whitespace, stopping at the end of the line."""
+        source = self.source
+        index = self.current_index
+        end = len(source)
+        while index < end:
+            char_code = ord(source[index])
+            if char_code >= 128 or not WHITESPACE_TABLE[char_code]:
+                break
+            # `\r\n` is a line ending, but a `\r` on its own is whitespace
+            if source[index] == "\r" and index + 1 < end and source[index + 1] == "\n":
+                break
+            index += 1
 
-            if option == snippet:
-                return True
+        self.advance_by(index - self.current_index)
 
-        return False
+    def advance_while_in(self, char_table: bytes) -> None:
+        """Advance over all following ASCII characters that are in `char_table`."""
+        source = self.source
+        index = self.current_index
+        end = len(source)
+        while index < end:
+            char_code = ord(source[index])
+            if char_code >= 128 or not char_table[char_code]:
+                break
+            index += 1
+
+        self.advance_by(index - self.current_index)
 
     def make_token(self, tok_type: TokenType) -> Token:
         if self.fstring_prefix is not None and "t" in self.fstring_prefix:
@@ -263,14 +365,14 @@ class TokenIterator:
             elif tok_type == TokenType.fstring_end:
                 tok_type = TokenType.tstring_end
 
-        token_type = (
-            TokenType.op
-            if self.weird_op_case
-            and not tok_type.is_operator()
-            and tok_type not in (TokenType.number, TokenType.string)
-            else tok_type
-        )
+        token_type = tok_type
         if self.weird_op_case:
+            if not tok_type.is_operator() and tok_type not in (
+                TokenType.number,
+                TokenType.string,
+            ):
+                token_type = TokenType.op
+
             # And we have another weird case INSIDE the weird case.
             # For some reason when CPython accidentally captures a space
             # as the next character, i.e. when the token is '\r ',
@@ -286,13 +388,13 @@ class TokenIterator:
             self.weird_op_case = False
 
         token = Token(
-            type=token_type,
-            start_index=self.prev_index,
-            end_index=self.current_index,
-            start_line=self.prev_line_number,
-            start_col=self.prev_byte_offset,
-            end_line=self.line_number,
-            end_col=self.byte_offset,
+            token_type,
+            self.prev_index,
+            self.current_index,
+            self.prev_line_number,
+            self.prev_byte_offset,
+            self.line_number,
+            self.byte_offset,
         )
         if tok_type == TokenType.newline or tok_type == TokenType.nl:
             self.next_line()
@@ -332,8 +434,9 @@ class TokenIterator:
 
     def newline(self) -> Token:
         if self.is_in_bounds() and self.source[self.current_index] == "\r":
+            self.advance_by(2)
+        else:
             self.advance()
-        self.advance()
         token_type = (
             TokenType.nl
             if (
@@ -359,98 +462,89 @@ class TokenIterator:
         return self.make_token(TokenType.endmarker)
 
     def decimal(self) -> Token:
+        source = self.source
+        end = len(source)
+        index = self.current_index
+
         digit_before_decimal = False
-        if self.source[self.current_index].isdigit():
+        if source[index].isdigit():
             digit_before_decimal = True
-            self.advance()
+            index += 1
 
         # TODO: this is too lax; 1__2 tokenizes successfully
-        while self.is_in_bounds() and (
-            self.source[self.current_index].isdigit()
-            or self.source[self.current_index] == "_"
-        ):
-            self.advance()
+        while index < end and (source[index].isdigit() or source[index] == "_"):
+            index += 1
 
-        if self.is_in_bounds() and self.source[self.current_index] == ".":
-            self.advance()
+        if index < end and source[index] == ".":
+            index += 1
 
-        while self.is_in_bounds() and (
-            self.source[self.current_index].isdigit()
-            or (
-                self.source[self.current_index] == "_"
-                and self.source[self.current_index - 1].isdigit()
-            )
+        while index < end and (
+            source[index].isdigit()
+            or (source[index] == "_" and source[index - 1].isdigit())
         ):
-            self.advance()
+            index += 1
         # Before advancing over the 'e', ensure that there has been at least 1 digit before the 'e'
-        if self.current_index + 1 < len(self.source) and (
-            (digit_before_decimal or self.source[self.current_index - 1].isdigit())
-            and (
-                self.source[self.current_index] == "e"
-                or self.source[self.current_index] == "E"
-            )
+        if index + 1 < end and (
+            (digit_before_decimal or source[index - 1].isdigit())
+            and (source[index] == "e" or source[index] == "E")
             and (
-                self.source[self.current_index + 1].isdigit()
+                source[index + 1].isdigit()
                 or (
-                    self.current_index + 2 < len(self.source)
-                    and (
-                        self.source[self.current_index + 1] == "+"
-                        or self.source[self.current_index + 1] == "-"
-                    )
-                    and self.source[self.current_index + 2].isdigit()
+                    index + 2 < end
+                    and (source[index + 1] == "+" or source[index + 1] == "-")
+                    and source[index + 2].isdigit()
                 )
             )
         ):
-            self.advance()
-            self.advance()
+            index += 2
             # optional third advance not necessary as itll get advanced just below
 
         # TODO: this is too lax; 1__2 tokenizes successfully
-        while self.is_in_bounds() and (
-            self.source[self.current_index].isdigit()
+        while index < end and (
+            source[index].isdigit()
             or (
-                (digit_before_decimal or self.source[self.current_index - 1].isdigit())
-                and self.source[self.current_index] == "_"
+                (digit_before_decimal or source[index - 1].isdigit())
+                and source[index] == "_"
             )
         ):
-            self.advance()
+            index += 1
 
         # Complex numbers end in a `j`. But ensure at least 1 digit before it
-        if self.is_in_bounds() and (
-            (digit_before_decimal or self.source[self.current_index - 1].isdigit())
-            and (
-                self.source[self.current_index] == "j"
-                or self.source[self.current_index] == "J"
-            )
+        if index < end and (
+            (digit_before_decimal or source[index - 1].isdigit())
+            and (source[index] == "j" or source[index] == "J")
         ):
-            self.advance()
+            index += 1
+
+        self.advance_by(index - self.current_index)
         # If all of this resulted in just a dot, return an operator
-        if (
-            self.current_index - self.prev_index == 1
-            and self.source[self.current_index - 1] == "."
-        ):
+        if index - self.prev_index == 1 and source[index - 1] == ".":
             # Ellipsis check
-            if (
-                self.current_index + 2 <= len(self.source)
-                and self.source[self.current_index : self.current_index + 2] == ".."
-            ):
-                self.advance()
-                self.advance()
+            if index + 2 <= end and source[index : index + 2] == "..":
+                self.advance_by(2)
 
             return self.make_token(TokenType.op)
 
         return self.make_token(TokenType.number)
 
+    def number(self) -> Token:
+        source = self.source
+        index = self.current_index
+        if source[index] == "0" and index + 1 < len(source):
+            radix_char = source[index + 1]
+            if radix_char == "b" or radix_char == "B":
+                return self.binary()
+            if radix_char == "o" or radix_char == "O":
+                return self.octal()
+            if radix_char == "x" or radix_char == "X":
+                return self.hexadecimal()
+
+        return self.decimal()
+
     def binary(self) -> Token:
         # jump over `0b`
-        self.advance()
-        self.advance()
-        while self.is_in_bounds() and (
-            self.source[self.current_index] == "0"
-            or self.source[self.current_index] == "1"
-            or self.source[self.current_index] == "_"
-        ):
-            self.advance()
+        self.advance_by(2)
+        self.advance_while_in(BINARY_DIGITS_TABLE)
         if self.is_in_bounds() and (
             self.source[self.current_index] == "e"
             or self.source[self.current_index] == "E"
@@ -459,24 +553,13 @@ class TokenIterator:
             if self.is_in_bounds() and self.source[self.current_index] == "-":
                 self.advance()
 
-        while self.is_in_bounds() and (
-            self.source[self.current_index] == "0"
-            or self.source[self.current_index] == "1"
-            or self.source[self.current_index] == "_"
-        ):
-            self.advance()
+        self.advance_while_in(BINARY_DIGITS_TABLE)
         return self.make_token(TokenType.number)
 
     def octal(self) -> Token:
         # jump over `0o`
-        self.advance()
-        self.advance()
-        while self.is_in_bounds() and (
-            self.source[self.current_index] >= "0"
-            and self.source[self.current_index] <= "7"
-            or self.source[self.current_index] == "_"
-        ):
-            self.advance()
+        self.advance_by(2)
+        self.advance_while_in(OCTAL_DIGITS_TABLE)
         if self.is_in_bounds() and (
             self.source[self.current_index] == "e"
             or self.source[self.current_index] == "E"
@@ -485,23 +568,13 @@ class TokenIterator:
             if self.is_in_bounds() and self.source[self.current_index] == "-":
                 self.advance()
 
-        while self.is_in_bounds() and (
-            self.source[self.current_index] >= "0"
-            and self.source[self.current_index] <= "7"
-            or self.source[self.current_index] == "_"
-        ):
-            self.advance()
+        self.advance_while_in(OCTAL_DIGITS_TABLE)
         return self.make_token(TokenType.number)
 
     def hexadecimal(self) -> Token:
         # jump over `0x`
-        self.advance()
-        self.advance()
-        while self.is_in_bounds() and (
-            self.source[self.current_index] in string.hexdigits
-            or self.source[self.current_index] == "_"
-        ):
-            self.advance()
+        self.advance_by(2)
+        self.advance_while_in(HEX_DIGITS_TABLE)
         if self.is_in_bounds() and (
             self.source[self.current_index] == "e"
             or self.source[self.current_index] == "E"
@@ -510,13 +583,24 @@ class TokenIterator:
             if self.is_in_bounds() and self.source[self.current_index] == "-":
                 self.advance()
 
-        while self.is_in_bounds() and (
-            self.source[self.current_index] in string.hexdigits
-            or self.source[self.current_index] == "_"
-        ):
-            self.advance()
+        self.advance_while_in(HEX_DIGITS_TABLE)
         return self.make_token(TokenType.number)
 
+    def is_string_start(self) -> bool:
+        source = self.source
+        index = self.current_index
+        # Most names can be ruled out by their first character alone
+        char_code = ord(source[index])
+        if char_code >= 128 or not STRING_START_CHARS_TABLE[char_code]:
+            return False
+
+        # Quotes should always be within 3 chars of the beginning of the string token
+        return (
+            source[index : index + 1] in STRING_STARTS
+            or source[index : index + 2] in STRING_STARTS
+            or source[index : index + 3] in STRING_STARTS
+        )
+
     def find_opening_quote(self) -> int:
         # Quotes should always be within 3 chars of the beginning of the string token
         for offset in range(3):
@@ -532,16 +616,11 @@ class TokenIterator:
         quote_char = self.source[quote_index]
 
         # Check for triple quotes
-        quote = (
-            self.source[quote_index : quote_index + 3]
-            if (
-                quote_index + 3 <= len(self.source)
-                and self.source[quote_index + 1] == quote_char
-                and self.source[quote_index + 2] == quote_char
-            )
-            else self.source[quote_index : quote_index + 1]
-        )
-        return prefix, quote
+        triple_quote = quote_char * 3
+        if self.source.startswith(triple_quote, quote_index):
+            return prefix, triple_quote
+
+        return prefix, quote_char
 
     def fstring(self) -> Token:
         if self.fstring_state.state in (
@@ -551,18 +630,22 @@ class TokenIterator:
             prefix, quote = self.string_prefix_and_quotes()
 
             self.push_fstring_prefix_quote(prefix, quote)
-            for _ in range(len(prefix)):
-                self.advance()
-            for _ in range(len(quote)):
-                self.advance()
+            self.advance_by(len(prefix) + len(quote))
             self.fstring_state.enter_fstring()
             return self.make_token(TokenType.fstring_start)
 
         if self.fstring_state.state == FStringState.at_fstring_middle:
             assert self.fstring_quote is not None
             is_single_quote = len(self.fstring_quote) == 1
+            special_chars = FSTRING_MIDDLE_SPECIAL_CHARS[self.fstring_quote]
             start_index = self.current_index
             while self.is_in_bounds():
+                # Skip ahead to the next character that needs handling
+                special_char = special_chars.search(self.source, self.current_index)
+                if special_char is None:
+                    break
+                self.advance_to(special_char.start())
+
                 char = self.source[self.current_index]
                 # For single quotes, bail on newlines
                 if char == "\n" and is_single_quote:
@@ -606,7 +689,7 @@ class TokenIterator:
                         return self.make_token(TokenType.fstring_middle)
 
                 assert self.fstring_quote is not None
-                if self.match(self.fstring_quote):
+                if self.source.startswith(self.fstring_quote, self.current_index):
                     self.fstring_state.consume_fstring_middle_for_end()
                     # If fstring-middle is empty, skip it by returning the next step token
                     if self.current_index == start_index:
@@ -627,8 +710,7 @@ class TokenIterator:
 
         if self.fstring_state.state == FStringState.at_fstring_end:
             assert self.fstring_quote is not None
-            for _ in range(len(self.fstring_quote)):
-                self.advance()
+            self.advance_by(len(self.fstring_quote))
             token = self.make_token(TokenType.fstring_end)
             self.pop_fstring_quote()
             self.fstring_state.leave_fstring()
@@ -637,6 +719,14 @@ class TokenIterator:
         if self.fstring_state.state == FStringState.in_fstring_expr_modifier:
             start_index = self.current_index
             while self.is_in_bounds():
+                # Skip ahead to the next character that needs handling
+                special_char = FSTRING_MODIFIER_SPECIAL_CHARS.search(
+                    self.source, self.current_index
+                )
+                if special_char is None:
+                    break
+                self.advance_by(special_char.start() - self.current_index)
+
                 char = self.source[self.current_index]
                 assert self.fstring_quote is not None
                 if (char == "\n" or char == "{") and len(self.fstring_quote) == 1:
@@ -667,18 +757,21 @@ class TokenIterator:
             self.advance()
             return self.make_token(tok_type=TokenType.op)
 
-        for char in prefix:
-            if char in ("f", "F", "t", "T"):
-                return self.fstring()
+        if prefix in FSTRING_PREFIXES:
+            return self.fstring()
 
-        for _ in range(len(prefix)):
-            self.advance()
-        for _ in range(len(quote)):
-            self.advance()
+        self.advance_by(len(prefix) + len(quote))
 
         is_single_quote = len(quote) == 1
+        special_chars = STRING_SPECIAL_CHARS[quote]
 
         while self.is_in_bounds():
+            # Skip ahead to the next character that needs handling
+            special_char = special_chars.search(self.source, self.current_index)
+            if special_char is None:
+                break
+            self.advance_to(special_char.start())
+
             char = self.source[self.current_index]
             # For single quotes, bail on newlines
             if char == "\n" and is_single_quote:
@@ -691,9 +784,8 @@ class TokenIterator:
                 continue
 
             # Find closing quote
-            if self.match(quote):
-                for _ in range(len(quote)):
-                    self.advance()
+            if self.source.startswith(quote, self.current_index):
+                self.advance_by(len(quote))
                 return self.make_token(TokenType.string)
 
             self.advance_check_newline()
@@ -702,17 +794,10 @@ class TokenIterator:
 
     def indent(self) -> Token:
         start_index = self.current_index
-        saw_whitespace = False
-        saw_tab_or_space = False
-        while self.is_in_bounds():
-            char = self.source[self.current_index]
-            if self.is_whitespace():
-                self.advance()
-                saw_whitespace = True
-                if char == " " or char == "\t":
-                    saw_tab_or_space = True
-            else:
-                break
+        self.advance_over_whitespace()
+        new_indent = self.source[start_index : self.current_index]
+        saw_whitespace = len(new_indent) > 0
+        saw_tab_or_space = " " in new_indent or "\t" in new_indent
 
         if not self.is_in_bounds():
             # File ends with no whitespace after newline, don't return indent
@@ -733,7 +818,6 @@ class TokenIterator:
         if next_char == "#" or next_char == "\\" or self.is_newline():
             return self.make_token(TokenType.whitespace)
 
-        new_indent = self.source[start_index : self.current_index]
         current_indent = "" if len(self.indent_stack) == 0 else self.indent_stack[-1]
 
         if len(new_indent) == len(current_indent):
@@ -769,14 +853,8 @@ class TokenIterator:
         if self.is_newline():
             return False
 
-        char = self.source[self.current_index]
-        return (
-            char == " "
-            or char == "\r"
-            or char == "\t"
-            or char == "\x0b"
-            or char == "\x0c"
-        )
+        char_code = ord(self.source[self.current_index])
+        return char_code < 128 and WHITESPACE_TABLE[char_code] == 1
 
     def is_newline(self) -> bool:
         if self.source[self.current_index] == "\n":
@@ -801,14 +879,90 @@ class TokenIterator:
         index = self.current_index
         end = len(source)
         while index < end:
-            char = source[index]
-            if ord(char) < 128 and not char.isalnum() and char != "_":
+            char_code = ord(source[index])
+            if char_code < 128 and not IDENTIFIER_CHARS_TABLE[char_code]:
                 break
             index += 1
 
         self.advance_by(index - self.current_index)
         return self.make_token(TokenType.identifier)
 
+    def operator(self) -> Token:
+        # Keep extending the operator for as long as that makes a longer one
+        source = self.source
+        operator = source[self.current_index]
+        index = self.current_index + 1
+        end = len(source)
+        while index < end:
+            transitions = OPERATOR_TRIE.get(operator)
+            if transitions is None:
+                break
+            longer_operator = transitions.get(source[index])
+            if longer_operator is None:
+                break
+            operator = longer_operator
+            index += 1
+
+        self.advance_by(index - self.current_index)
+        return self.make_token(TokenType.op)
+
+    def single_char_operator(self) -> Token:
+        # `,`, `;`, and the backtick. The backtick is not used in Python3,
+        # but still exists for backwards compatibility i guess.
+        self.advance()
+        return self.make_token(TokenType.op)
+
+    def lparen(self) -> Token:
+        self.advance()
+        self.bracket_level += 1
+        return self.make_token(TokenType.lparen)
+
+    def rparen(self) -> Token:
+        self.advance()
+        self.bracket_level = max(self.bracket_level - 1, 0)
+        return self.make_token(TokenType.rparen)
+
+    def lbracket(self) -> Token:
+        self.advance()
+        self.bracket_level += 1
+        return self.make_token(TokenType.lbracket)
+
+    def rbracket(self) -> Token:
+        self.advance()
+        self.bracket_level = max(self.bracket_level - 1, 0)
+        return self.make_token(TokenType.rbracket)
+
+    def lbrace(self) -> Token:
+        self.advance()
+        self.bracket_level += 1
+        return self.make_token(TokenType.lbrace)
+
+    def rbrace(self) -> Token:
+        self.advance()
+        if (
+            self.bracket_level == 0
+            and self.fstring_state.state == FStringState.in_fstring_expr
+        ):
+            self.fstring_state.consume_rbrace()
+            self.bracket_level = self.bracket_level_stack.pop()
+        else:
+            self.bracket_level = max(self.bracket_level - 1, 0)
+
+        return self.make_token(TokenType.rbrace)
+
+    def colon(self) -> Token:
+        self.advance()
+        if (
+            self.bracket_level == 0
+            and self.fstring_state.state == FStringState.in_fstring_expr
+        ):
+            self.fstring_state.state = FStringState.in_fstring_expr_modifier
+            return self.make_token(TokenType.op)
+        else:
+            if self.is_in_bounds() and self.peek() == "=":
+                self.advance()
+            return self.make_token(TokenType.op)
+
     def __iter__(self) -> TokenIterator:
         return self
 
@@ -816,31 +970,47 @@ class TokenIterator:
         if self.prev_token is not None and self.prev_token.type == TokenType.endmarker:
             raise StopIteration
 
+        # Empty the dedent counter. indent() only counts dedents once it has
+        # stopped in front of the next token, so none of the checks below
+        # could apply yet, and the dedents can be emitted right away.
+        if self.dedent_counter > 0:
+            self.dedent_counter -= 1
+
+            # Dedents after an escaped newline should be treated as a dedent
+            # without emmitting a dedent token
+            if not self.line_after_escaped_nl:
+                return self.make_token(TokenType.dedent)
+
+        source = self.source
+        source_length = len(source)
+
         # EOF checks
-        if self.current_index == len(self.source):
+        if self.current_index == source_length:
             if self.prev_token is None:
                 return self.endmarker()
 
-            if self.prev_token.type in {
-                TokenType.newline,
-                TokenType.nl,
-                TokenType.dedent,
-            }:
+            prev_type = self.prev_token.type
+            if (
+                prev_type == TokenType.newline
+                or prev_type == TokenType.nl
+                or prev_type == TokenType.dedent
+            ):
                 return self.endmarker()
             else:
                 return self.newline()
 
-        if self.current_index > len(self.source):
+        if self.current_index > source_length:
             return self.endmarker()
 
         # f-string check
+        fstring_state = self.fstring_state.state
         if (
-            self.fstring_state.state != FStringState.not_fstring
-            and self.fstring_state.state != FStringState.in_fstring_expr
+            fstring_state != FStringState.not_fstring
+            and fstring_state != FStringState.in_fstring_expr
         ):
             return self.fstring()
 
-        current_char = self.source[self.current_index]
+        current_char = source[self.current_index]
 
         # \r on its own, in certain cases it gets merged with the next char.
         # It's probably a bug: https://github.com/python/cpython/issues/128233
@@ -851,7 +1021,7 @@ class TokenIterator:
             if not self.is_in_bounds():
                 return self.newline()
 
-            current_char = self.source[self.current_index]
+            current_char = source[self.current_index]
             if current_char != "\n":
                 self.weird_op_case = True
                 if (
@@ -866,24 +1036,20 @@ class TokenIterator:
                 self.advance()
                 return self.make_token(TokenType.comment)
 
-            while self.is_in_bounds() and not self.is_newline():
-                if (
-                    not self.issue_128233_handling
-                    and self.source[self.current_index] == "\r"
-                ):
-                    break
-                self.advance()
+            # The comment goes on until the end of the line
+            end = source.find("\n", self.current_index)
+            if end == -1:
+                end = source_length
+            elif source[end - 1] == "\r":
+                end -= 1
+            if not self.issue_128233_handling:
+                carriage_return = source.find("\r", self.current_index, end)
+                if carriage_return != -1:
+                    end = carriage_return
+
+            self.advance_by(end - self.current_index)
             return self.make_token(TokenType.comment)
 
-        # Empty the dedent counter
-        if self.dedent_counter > 0:
-            self.dedent_counter -= 1
-
-            # Dedents after an escaped newline should be treated as a dedent
-            # without emmitting a dedent token
-            if not self.line_after_escaped_nl:
-                return self.make_token(TokenType.dedent)
-
         # Newline check
         if self.is_newline():
             return self.newline()
@@ -899,13 +1065,11 @@ class TokenIterator:
             seen_newline = False
             while self.is_in_bounds():
                 if self.is_whitespace():
-                    self.advance()
+                    self.advance_over_whitespace()
                     found_whitespace = True
                 elif not seen_newline and (self.is_newline()):
-                    char = self.source[self.current_index]
-                    if char == "\r":
-                        self.advance()
-                    self.advance()
+                    char = source[self.current_index]
+                    self.advance_by(2 if char == "\r" else 1)
                     found_whitespace = True
                     seen_newline = True
                     # Move to next line without creating a newline token. But,
@@ -944,190 +1108,91 @@ class TokenIterator:
                 return indent_token
 
         if self.is_whitespace():
-            while self.is_in_bounds() and self.is_whitespace():
-                self.advance()
+            self.advance_over_whitespace()
             return self.make_token(TokenType.whitespace)
 
-        if current_char in ("+", "&", "|", "^", "@", "%", "=", "!", "~"):
-            self.advance()
-            if self.peek() == "=":
-                self.advance()
-            return self.make_token(TokenType.op)
-
-        if current_char == "<":
-            self.advance()
-            if self.peek() == ">":
-                # Barry as FLUFL easter egg
-                self.advance()
-                return self.make_token(TokenType.op)
-
-            if self.peek() == "<":
-                self.advance()
-            if self.peek() == "=":
-                self.advance()
-            return self.make_token(TokenType.op)
-
-        if current_char == ">":
-            self.advance()
-            if self.peek() == ">":
-                self.advance()
-            if self.peek() == "=":
-                self.advance()
-            return self.make_token(TokenType.op)
-
-        if current_char == "/":
-            self.advance()
-            if self.peek() == "/":
-                self.advance()
-            if self.peek() == "=":
-                self.advance()
-            return self.make_token(TokenType.op)
-
-        if current_char == "*":
-            self.advance()
-            if self.peek() == "*":
-                self.advance()
-            if self.peek() == "=":
-                self.advance()
-            return self.make_token(TokenType.op)
-
-        if current_char == "-":
-            self.advance()
-            # -> operator
-            if self.peek() == ">":
-                self.advance()
-                return self.make_token(TokenType.op)
-
-            # -= operator
-            if self.peek() == "=":
-                self.advance()
-            return self.make_token(TokenType.op)
-
-        if current_char in (",", ";"):
-            self.advance()
-            return self.make_token(TokenType.op)
-
-        # This guy is not used in Python3, but still exists
-        # for backwards compatibility i guess.
-        if current_char == "`":
-            self.advance()
-            return self.make_token(TokenType.op)
-
-        if current_char == "(":
-            self.advance()
-            self.bracket_level += 1
-            return self.make_token(TokenType.lparen)
-
-        if current_char == ")":
-            self.advance()
-            self.bracket_level -= 1
-            if self.bracket_level < 0:
-                self.bracket_level = 0
-            return self.make_token(TokenType.rparen)
-
-        if current_char == "[":
-            self.advance()
-            self.bracket_level += 1
-            return self.make_token(TokenType.lbracket)
-
-        if current_char == "]":
-            self.advance()
-            self.bracket_level -= 1
-            if self.bracket_level < 0:
-                self.bracket_level = 0
-            return self.make_token(TokenType.rbracket)
+        char_code = ord(current_char)
+        if char_code < 128:
+            token_handler = TOKEN_HANDLERS[char_code]
+            if token_handler is not None:
+                return token_handler(self)
 
-        if current_char == "{":
-            self.advance()
-            self.bracket_level += 1
-            return self.make_token(TokenType.lbrace)
-
-        if current_char == "}":
-            self.advance()
-            if (
-                self.bracket_level == 0
-                and self.fstring_state.state == FStringState.in_fstring_expr
-            ):
-                self.fstring_state.consume_rbrace()
-                self.bracket_level = self.bracket_level_stack.pop()
-            else:
-                self.bracket_level -= 1
-                if self.bracket_level < 0:
-                    self.bracket_level = 0
-
-            return self.make_token(TokenType.rbrace)
-
-        if current_char == ":":
-            self.advance()
-            if (
-                self.bracket_level == 0
-                and self.fstring_state.state == FStringState.in_fstring_expr
-            ):
-                self.fstring_state.state = FStringState.in_fstring_expr_modifier
-                return self.make_token(TokenType.op)
-            else:
-                if self.peek() == "=":
-                    self.advance()
-                return self.make_token(TokenType.op)
-
-        if current_char in ".0123456789":
-            if self.current_index + 2 <= len(self.source) and self.source[
-                self.current_index : self.current_index + 2
-            ] in ("0b", "0B"):
-                return self.binary()
-            elif self.current_index + 2 <= len(self.source) and self.source[
-                self.current_index : self.current_index + 2
-            ] in ("0o", "0O"):
-                return self.octal()
-            elif self.current_index + 2 <= len(self.source) and self.source[
-                self.current_index : self.current_index + 2
-            ] in ("0x", "0X"):
-                return self.hexadecimal()
-            else:
-                return self.decimal()
-
-        if (
-            (self.current_index + 1 <= len(self.source) and self.match('"', "'"))
-            or (
-                self.current_index + 2 <= len(self.source)
-                and self.match(
-                    'b"',
-                    "b'",
-                    'r"',
-                    "r'",
-                    'f"',
-                    "f'",
-                    'u"',
-                    "u'",
-                    "t'",
-                    't"',
-                    ignore_case=True,
-                )
-            )
-            or (
-                self.current_index + 3 <= len(self.source)
-                and self.match(
-                    'br"',
-                    "br'",
-                    'rb"',
-                    "rb'",
-                    'fr"',
-                    "fr'",
-                    'rf"',
-                    "rf'",
-                    "tr'",
-                    'tr"',
-                    "rt'",
-                    'rt"',
-                    ignore_case=True,
-                )
-            )
-        ):
+        if self.is_string_start():
             return self.string()
 
         return self.name()
 
 
+# Operators longer than one character. All of their prefixes are operators too.
+# `<>` is the Barry as FLUFL easter egg.
+MULTI_CHAR_OPERATORS = (
+    "+=",
+    "-=",
+    "*=",
+    "/=",
+    "%=",
+    "@=",
+    "&=",
+    "|=",
+    "^=",
+    "~=",
+    "==",
+    "!=",
+    "<=",
+    ">=",
+    "<>",
+    "->",
+    "**",
+    "**=",
+    "//",
+    "//=",
+    "<<",
+    "<<=",
+    ">>",
+    ">>=",
+)
+
+
+def _build_operator_trie() -> dict[str, dict[str, str]]:
+    """Map each operator to the characters that extend it into a longer one."""
+    operator_trie: dict[str, dict[str, str]] = {}
+    for operator in MULTI_CHAR_OPERATORS:
+        operator_trie.setdefault(operator[:-1], {})[operator[-1]] = operator
+    return operator_trie
+
+
+OPERATOR_TRIE: Final = _build_operator_trie()
+
+
+def _build_token_handlers() -> list[Callable[[TokenIterator], Token] | None]:
+    """Map the ASCII code of a token's first character to the method lexing it.
+
+    Operators, numbers and unprefixed strings are looked up this way, rather
+    than comparing the character against each one in turn.
+    """
+    token_handlers: list[Callable[[TokenIterator], Token] | None] = [None] * 128
+    for token_chars, token_handler in (
+        ("+-*/%@&|^~=!<>", TokenIterator.operator),
+        (",;`", TokenIterator.single_char_operator),
+        ("(", TokenIterator.lparen),
+        (")", TokenIterator.rparen),
+        ("[", TokenIterator.lbracket),
+        ("]", TokenIterator.rbracket),
+        ("{", TokenIterator.lbrace),
+        ("}", TokenIterator.rbrace),
+        (":", TokenIterator.colon),
+        (".0123456789", TokenIterator.number),
+        ("'\"", TokenIterator.string),
+    ):
+        for token_char in token_chars:
+            token_handlers[ord(token_char)] = token_handler
+
+    return token_handlers
+
+
+TOKEN_HANDLERS: Final = _build_token_handlers()
+
+
 def tokenize(
     source: str,
     *,
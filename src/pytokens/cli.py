@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import enum
+import functools
 import io
 import json
+import multiprocessing
 import os.path
 import tokenize
-from typing import Iterable, NamedTuple
+from typing import Iterable, Iterator, NamedTuple
 import warnings
 
 import pytokens
@@ -29,6 +32,7 @@ class CLIArgs:
     json: bool
     strict: bool
     quiet: bool
+    jobs: int
 
 
 def cli(argv: list[str] | None = None) -> int:
@@ -44,7 +48,7 @@ def cli(argv: list[str] | None = None) -> int:
     parser.add_argument(
         "--json",
         action="store_true",
-        help="Output validation results as JSON",
+        help="Output validation results as JSON, one object per line",
     )
     parser.add_argument(
         "--strict",
@@ -56,6 +60,13 @@ def cli(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Suppress visual output (dots, S, F)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of processes to validate files with (default: 1)",
+    )
     args = parser.parse_args(argv, namespace=CLIArgs())
 
     # --json implies --quiet
@@ -69,53 +80,12 @@ def cli(argv: list[str] | None = None) -> int:
         files = [args.filepath]
         verbose = True
 
-    validation_results: list[dict[str, str]] = []
-    failure_count = 0
-
-    for filepath in sorted(files):
-        with open(filepath, "rb") as file:
-            try:
+    if not args.validate:
+        for filepath in sorted(files):
+            with open(filepath, "rb") as file:
                 encoding, read_bytes = tokenize.detect_encoding(file.readline)
-            except SyntaxError:
-                if args.validate:
-                    # Broken `# coding` comment, tokenizer bails, skip file
-                    if not args.quiet:
-                        print("\033[1;33mS\033[0m", end="", flush=True)
-                    if args.json:
-                        validation_results.append(
-                            {
-                                "filepath": filepath,
-                                "status": ValidationStatus.SKIP.value,
-                            }
-                        )
-                    continue
-
-                raise
-
-            source = b"".join(read_bytes) + file.read()
-
-        if args.validate:
-            status = validate(
-                filepath,
-                source,
-                encoding,
-                verbose=verbose,
-                issue_128233_handling=args.issue_128233_handling,
-                quiet=args.quiet,
-            )
+                source = b"".join([*read_bytes, file.read()])
 
-            if args.json:
-                validation_results.append(
-                    {
-                        "filepath": filepath,
-                        "status": status.value,
-                    }
-                )
-
-            if status == ValidationStatus.FAILURE:
-                failure_count += 1
-
-        else:
             source_str = source.decode(encoding)
             for token in pytokens.tokenize(
                 source_str,
@@ -124,8 +94,33 @@ def cli(argv: list[str] | None = None) -> int:
                 token_source = source_str[token.start_index : token.end_index]
                 print(repr(token_source), token)
 
-    if args.json and args.validate:
-        print(json.dumps(validation_results, indent=2))
+        return 0
+
+    sorted_files = sorted(files)
+    validate_one = functools.partial(
+        validate_file,
+        verbose=verbose,
+        issue_128233_handling=args.issue_128233_handling,
+        quiet=args.quiet,
+    )
+    statuses: Iterable[ValidationStatus]
+    failure_count = 0
+
+    with contextlib.ExitStack() as stack:
+        if args.jobs > 1 and len(sorted_files) > 1:
+            pool = stack.enter_context(multiprocessing.Pool(args.jobs))
+            # Big enough chunks to amortize IPC, small enough to balance load
+            chunksize = max(1, min(64, len(sorted_files) // (args.jobs * 4)))
+            statuses = pool.imap(validate_one, sorted_files, chunksize=chunksize)
+        else:
+            statuses = map(validate_one, sorted_files)
+
+        for filepath, status in zip(sorted_files, statuses):
+            if args.json:
+                print_json_result(filepath, status)
+
+            if status == ValidationStatus.FAILURE:
+                failure_count += 1
 
     if args.strict and failure_count > 0:
         return 1
@@ -133,12 +128,95 @@ def cli(argv: list[str] | None = None) -> int:
     return 0
 
 
+def validate_file(
+    filepath: str,
+    *,
+    issue_128233_handling: bool,
+    verbose: bool = True,
+    quiet: bool = False,
+) -> ValidationStatus:
+    """Read and validate a single file."""
+    with open(filepath, "rb") as file:
+        try:
+            encoding, read_bytes = tokenize.detect_encoding(file.readline)
+        except SyntaxError:
+            # Broken `# coding` comment, tokenizer bails, skip file
+            if not quiet:
+                print("\033[1;33mS\033[0m", end="", flush=True)
+            return ValidationStatus.SKIP
+
+        source = b"".join([*read_bytes, file.read()])
+
+    return validate(
+        filepath,
+        source,
+        encoding,
+        verbose=verbose,
+        issue_128233_handling=issue_128233_handling,
+        quiet=quiet,
+    )
+
+
+def print_json_result(filepath: str, status: ValidationStatus) -> None:
+    """Print the validation result for a single file as a line of JSON."""
+    result = {"filepath": filepath, "status": status.value}
+    print(json.dumps(result, separators=(",", ":")))
+
+
 class TokenTuple(NamedTuple):
     type: str
     start: tuple[int, int]
     end: tuple[int, int]
 
 
+# Token names as CPython's tokenize module spells them, indexed by token type,
+# so that validation doesn't have to look them up again for every token.
+CPYTHON_TOKEN_NAMES = [
+    tokenize.tok_name.get(token_type, "")
+    for token_type in range(max(tokenize.tok_name) + 1)
+]
+
+
+def fix_fstring_middles(tokens: list[TokenTuple]) -> Iterator[TokenTuple]:
+    """Yield CPython's tokens, with its FSTRING_MIDDLE quirks smoothed over."""
+    pending_token = tokens[0]
+    for index in range(1, len(tokens)):
+        current_token = tokens[index]
+        # Merge consecutive FSTRING_MIDDLE tokens. it's weird cpython has it like that.
+        if current_token.type == pending_token.type == "FSTRING_MIDDLE":
+            current_token = TokenTuple(
+                current_token.type,
+                pending_token.start,
+                current_token.end,
+            )
+        else:
+            yield pending_token
+
+        if current_token.type == "FSTRING_MIDDLE" and index + 1 < len(tokens):
+            # When an FSTRING_MIDDLE ends with a `{{{` like f'x{{{1}', Python eats
+            # the last { char as well as its end index, so we get a `x{` token
+            # instead of the expected `x{{` token. This fixes that case. Pretty
+            # much always there should be no gap between an fstring-middle ending
+            # and the { op after it.
+            # Same deal for `}}}"`
+            next_token = tokens[index + 1]
+            if next_token.type == "OP" or (
+                next_token.type == "FSTRING_END"
+                and next_token.start[0] == current_token.end[0]
+                and next_token.start[1] > current_token.end[1]
+            ):
+                pending_token = TokenTuple(
+                    current_token.type,
+                    current_token.start,
+                    next_token.start,
+                )
+                continue
+
+        pending_token = current_token
+
+    yield pending_token
+
+
 def validate(
     filepath: str,
     source: bytes,
@@ -155,11 +233,6 @@ def validate(
     if len(source) == 0 or source[-1:] != b"\n":
         source = source + b"\n"
 
-    # Same as .splitlines(keepends=True), but doesn't split on linefeeds i.e. \x0c
-    sourcelines = [line + b"\n" for line in source.split(b"\n")]
-    # For that last newline token that exists on an imaginary line sometimes
-    sourcelines.append(b"\n")
-
     source_file = io.BytesIO(source)
     builtin_tokens = tokenize.tokenize(source_file.readline)
     # drop the encoding token
@@ -167,7 +240,7 @@ def validate(
 
     try:
         expected_tokens_unprocessed = [
-            TokenTuple(tokenize.tok_name[token.type], token.start, token.end)
+            TokenTuple(CPYTHON_TOKEN_NAMES[token.type], token.start, token.end)
             for token in builtin_tokens
         ]
     except tokenize.TokenError:
@@ -175,52 +248,12 @@ def validate(
             print("\033[1;33mS\033[0m", end="", flush=True)
         return ValidationStatus.SKIP
 
-    expected_tokens = [expected_tokens_unprocessed[0]]
-    for index, token in enumerate(expected_tokens_unprocessed[1:], start=1):
-        last_token = expected_tokens[-1]
-
-        current_token = token
-        # Merge consecutive FSTRING_MIDDLE tokens. it's weird cpython has it like that.
-        if current_token.type == last_token.type == "FSTRING_MIDDLE":
-            expected_tokens.pop()
-            current_token = TokenTuple(
-                current_token.type,
-                last_token.start,
-                current_token.end,
-            )
-
-        if index + 1 < len(expected_tokens_unprocessed):
-            # When an FSTRING_MIDDLE ends with a `{{{` like f'x{{{1}', Python eats
-            # the last { char as well as its end index, so we get a `x{` token
-            # instead of the expected `x{{` token. This fixes that case. Pretty
-            # much always there should be no gap between an fstring-middle ending
-            # and the { op after it.
-            # Same deal for `}}}"`
-            next_token = expected_tokens_unprocessed[index + 1]
-            if (
-                (current_token.type == "FSTRING_MIDDLE" and next_token.type == "OP")
-                or (
-                    current_token.type == "FSTRING_MIDDLE"
-                    and next_token.type == "FSTRING_END"
-                )
-                and next_token.start[0] == current_token.end[0]
-                and next_token.start[1] > current_token.end[1]
-            ):
-                expected_tokens.append(
-                    TokenTuple(
-                        current_token.type,
-                        current_token.start,
-                        next_token.start,
-                    )
-                )
-                continue
-
-        expected_tokens.append(current_token)
+    expected_tokens = fix_fstring_middles(expected_tokens_unprocessed)
 
     source_string = source.decode(encoding)
     our_tokens = (
         TokenTuple(
-            token.type.to_python_token(),
+            pytokens.PYTHON_TOKEN_NAMES[token.type],
             (token.start_line, token.start_col),
             (token.end_line, token.end_col),
         )
@@ -251,8 +284,22 @@ def validate(
 def find_all_python_files(directory: str) -> Iterable[str]:
     """Recursively find all Python files in the given directory."""
     python_files = set()
-    for root, _, files in os.walk(directory, followlinks=False):
-        for file in files:
-            if file.endswith(".py"):
-                python_files.add(os.path.join(root, file))
+    directories = [directory]
+    while directories:
+        try:
+            entries = os.scandir(directories.pop())
+        except OSError:
+            # Same as `os.walk`, skip directories that can't be listed
+            continue
+
+        with entries:
+            for entry in entries:
+                # Directory entries cache their type, so this needs no extra stat
+                if entry.is_dir():
+                    # Don't follow symlinks to directories
+                    if not entry.is_symlink():
+                        directories.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    python_files.add(entry.path)
+
     return python_files
@@ -0,0 +1,48 @@
+import io
+
+import pytest
+
+from primer import iter_validation_output
+
+
+def test_iter_validation_output_ndjson() -> None:
+    stdout = io.BytesIO(
+        b'{"filepath": "a.py", "status": "SUCCESS"}\n'
+        b"\n"
+        b'{"filepath": "b.py", "status": "FAILURE"}\n'
+    )
+    assert list(iter_validation_output(stdout)) == [
+        {"filepath": "a.py", "status": "SUCCESS"},
+        {"filepath": "b.py", "status": "FAILURE"},
+    ]
+
+
+def test_iter_validation_output_array() -> None:
+    # Older versions of pytokens print a single indented JSON array
+    stdout = io.BytesIO(
+        b"[\n"
+        b"  {\n"
+        b'    "filepath": "a.py",\n'
+        b'    "status": "SUCCESS"\n'
+        b"  }\n"
+        b"]\n"
+    )
+    assert list(iter_validation_output(stdout)) == [
+        {"filepath": "a.py", "status": "SUCCESS"},
+    ]
+
+
+def test_iter_validation_output_empty() -> None:
+    # Older versions print an empty array as `[]`, for repos with no files
+    assert list(iter_validation_output(io.BytesIO(b"[]\n"))) == []
+    assert list(iter_validation_output(io.BytesIO(b""))) == []
+
+
+def test_iter_validation_output_truncated() -> None:
+    stdout = io.BytesIO(
+        b'{"filepath": "a.py", "status": "SUCCESS"}\n' b'{"filepath": "b.py", "sta'
+    )
+    results = iter_validation_output(stdout)
+    assert next(results) == {"filepath": "a.py", "status": "SUCCESS"}
+    with pytest.raises(EOFError):
+        next(results)
@@ -213,3 +213,51 @@ def test_dedent_after_escaped_nl() -> None:
         Token(T.dedent, 37, 37, start_line=5, start_col=0, end_line=5, end_col=0),
         Token(T.endmarker, 37, 37, start_line=5, start_col=0, end_line=5, end_col=0),
     ]
+
+
+def test_operator_at_eof() -> None:
+    source = "x**"
+    tokens = list(tokenize(source))
+    assert tokens == [
+        Token(T.identifier, 0, 1, start_line=1, start_col=0, end_line=1, end_col=1),
+        Token(T.op, 1, 3, start_line=1, start_col=1, end_line=1, end_col=3),
+        Token(T.newline, 3, 4, start_line=1, start_col=3, end_line=1, end_col=4),
+        Token(T.endmarker, 4, 4, start_line=2, start_col=0, end_line=2, end_col=0),
+    ]
+
+    source = "x:"
+    tokens = list(tokenize(source))
+    assert tokens == [
+        Token(T.identifier, 0, 1, start_line=1, start_col=0, end_line=1, end_col=1),
+        Token(T.op, 1, 2, start_line=1, start_col=1, end_line=1, end_col=2),
+        Token(T.newline, 2, 3, start_line=1, start_col=2, end_line=1, end_col=3),
+        Token(T.endmarker, 3, 3, start_line=2, start_col=0, end_line=2, end_col=0),
+    ]
+
+
+def test_multiline_strings() -> None:
+    source = 'x = """a\nbc\n"""\nf"""\n{x}\n y"""\n'
+    tokens = list(tokenize(source))
+    assert tokens == [
+        Token(T.identifier, 0, 1, start_line=1, start_col=0, end_line=1, end_col=1),
+        Token(T.whitespace, 1, 2, start_line=1, start_col=1, end_line=1, end_col=2),
+        Token(T.op, 2, 3, start_line=1, start_col=2, end_line=1, end_col=3),
+        Token(T.whitespace, 3, 4, start_line=1, start_col=3, end_line=1, end_col=4),
+        Token(T.string, 4, 15, start_line=1, start_col=4, end_line=3, end_col=3),
+        Token(T.newline, 15, 16, start_line=3, start_col=3, end_line=3, end_col=4),
+        Token(
+            T.fstring_start, 16, 20, start_line=4, start_col=0, end_line=4, end_col=4
+        ),
+        Token(
+            T.fstring_middle, 20, 21, start_line=4, start_col=4, end_line=5, end_col=0
+        ),
+        Token(T.lbrace, 21, 22, start_line=5, start_col=0, end_line=5, end_col=1),
+        Token(T.identifier, 22, 23, start_line=5, start_col=1, end_line=5, end_col=2),
+        Token(T.rbrace, 23, 24, start_line=5, start_col=2, end_line=5, end_col=3),
+        Token(
+            T.fstring_middle, 24, 27, start_line=5, start_col=3, end_line=6, end_col=2
+        ),
+        Token(T.fstring_end, 27, 30, start_line=6, start_col=2, end_line=6, end_col=5),
+        Token(T.newline, 30, 31, start_line=6, start_col=5, end_line=6, end_col=6),
+        Token(T.endmarker, 31, 31, start_line=7, start_col=0, end_line=7, end_col=0),
+    ]